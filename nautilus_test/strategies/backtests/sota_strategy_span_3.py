@@ -34,46 +34,42 @@ NATIVE COMPLIANCE: ⚠️ Experimental implementation with native patterns
    before incorporating into production examples.
 """
 
+import asyncio
+import json
+import logging
+import math
+import os
 import sys
-from datetime import datetime, timedelta
-from decimal import Decimal
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from decimal import ROUND_DOWN, ROUND_UP, Decimal
 from pathlib import Path
 
 # Add parent directories to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-# Import enhanced visualization functions
-from nautilus_test.visualization.enhanced_charts import (
-    add_enhanced_indicators,
-    add_realistic_trade_markers,
-    create_enhanced_candlestick_chart,
-    create_post_backtest_chart,
-    display_enhanced_chart,
-    display_ultimate_performance_summary,
-    prepare_bars_dataframe,
-)
-
 # Import position sizing
 from nautilus_test.providers.position_sizing import RealisticPositionSizer
 
 # Import Binance specifications
 from nautilus_test.providers.binance_specs import BinanceSpecificationManager
 
-import finplot as fplt
 import numpy as np
 import pandas as pd
-import pyqtgraph as pg
 from nautilus_trader.backtest.engine import BacktestEngine, BacktestEngineConfig
 from nautilus_trader.backtest.models import FillModel, MakerTakerFeeModel
 from nautilus_trader.common.actor import Actor
 from nautilus_trader.config import LoggingConfig, RiskEngineConfig
 from nautilus_trader.model.currencies import BTC, USDT
-from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.data import Bar, BarType, DataType
 from nautilus_trader.model.enums import AccountType, OmsType, OrderSide, TimeInForce
 from nautilus_trader.model.identifiers import InstrumentId, Symbol, TraderId, Venue
 from nautilus_trader.model.instruments import CryptoPerpetual
 from nautilus_trader.model.objects import Money, Price, Quantity
+from nautilus_trader.persistence.wranglers import BarDataWrangler
 from nautilus_trader.trading.strategy import Strategy
 from rich import box
 from rich.console import Console
@@ -99,8 +95,78 @@ except ImportError:
     ArrowDataManager = None
     DataPipeline = None
 
+try:
+    from nautilus_test.utils.cache_config import cache_manager
+except ImportError:
+    cache_manager = None
+
+# Optional Numba JIT for the per-bar numeric kernels - NumPy dispatch cost
+# dominates at the 20-50 element window sizes used by regime detection
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator fallback when Numba is not installed."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+
+        return wrap
+
+# Optional Arrow interop - pyarrow ships with the polars parquet path used by
+# ArrowDataManager, but it is not a hard dependency of this script
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+# Resolved once at import time so the precision-adjustment path does a single
+# typed dispatch per call instead of importing polars and probing attributes
+# on every invocation
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
 console = Console()
 
+# Level-gated diagnostics: %s-style arguments are only formatted when the
+# handler level is enabled, unlike the eagerly built Rich debug prints
+log = logging.getLogger(__name__)
+
+# Chart rendering is optional: finplot/pyqtgraph initialize Qt on import, which
+# is pure startup cost for headless runs.  Set ENABLE_CHART=0 to skip charts
+# (and the Qt import) entirely; the modules are loaded lazily on first use.
+ENABLE_CHART = os.environ.get("ENABLE_CHART", "1") == "1"
+
+# Deep-debug diagnostics (per-bar scans, cache enumeration, rich-formatted
+# tracing in main()) are opt-in - production runs skip the string building
+DEBUG = os.environ.get("SOTA_DEBUG") == "1"
+
+# Plain console for the deep-debug tracing: skips Rich markup parsing,
+# syntax highlighting, and emoji substitution on every call
+dbg_console = Console(markup=False, highlight=False, emoji=False)
+
+fplt = None
+pg = None
+
+
+def _load_finplot() -> None:
+    """Import finplot/pyqtgraph on first use so headless runs never touch Qt."""
+    global fplt, pg
+    if fplt is None:
+        import finplot
+        import pyqtgraph
+
+        fplt = finplot
+        pg = pyqtgraph
+
+
 # Import native funding rate system
 try:
     from nautilus_test.funding import (
@@ -112,6 +178,19 @@ except ImportError:
     FUNDING_AVAILABLE = False
     console.print("[yellow]⚠️ Native funding rate system not available[/yellow]")
 
+# Hoisted from FinplotActor.on_data - the import statement itself is cheap
+# once cached, but it still ran bytecode on every MessageBus event
+try:
+    from nautilus_test.funding.data import FundingPaymentEvent
+except ImportError:
+    FundingPaymentEvent = None
+
+# Hoisted from BinanceSpecificationManager.fetch_btcusdt_perpetual_specs
+try:
+    from binance import Client
+except ImportError:
+    Client = None
+
 
 class FinplotActor(Actor):
     """
@@ -125,14 +204,32 @@ class FinplotActor(Actor):
     For development: This embedded FinplotActor (may block event loop)
     """
 
-    def __init__(self, config=None):
+    # Initial per-column buffer capacity; doubled on overflow
+    _INITIAL_BUFFER_SIZE = 8192
+
+    def __init__(self, config=None, bar_type: BarType | None = None):
         super().__init__(config)
+        self._bar_type = bar_type
         self._ax = None
         self._ax2 = None
-        self._ohlc_buffer = []
-        self._volume_buffer = []
+        # Columnar OHLCV buffers (one float64 array per column plus a write
+        # cursor) - building the refresh DataFrames from these is zero-copy,
+        # unlike the previous list-of-rows rebuild
+        self._ohlc_capacity = self._INITIAL_BUFFER_SIZE
+        self._ohlc_ts = np.empty(self._ohlc_capacity, dtype=np.float64)
+        self._ohlc_o = np.empty(self._ohlc_capacity, dtype=np.float64)
+        self._ohlc_c = np.empty(self._ohlc_capacity, dtype=np.float64)
+        self._ohlc_h = np.empty(self._ohlc_capacity, dtype=np.float64)
+        self._ohlc_l = np.empty(self._ohlc_capacity, dtype=np.float64)
+        self._ohlc_v = np.empty(self._ohlc_capacity, dtype=np.float64)
+        self._ohlc_n = 0
         self._funding_events = []
         self._timer = None
+        # Persistent plot items plus a dirty bit so the 100ms timer only
+        # re-renders when new events arrived since the last frame
+        self._candle_item = None
+        self._volume_item = None
+        self._dirty = False
         self._backtest_mode = True  # Default to backtest mode
 
         # Skip chart styling in backtest mode to prevent window creation
@@ -144,6 +241,7 @@ class FinplotActor(Actor):
 
     def _setup_chart_theme(self):
         """Setup enhanced dark theme for real data visualization."""
+        _load_finplot()
         fplt.foreground = "#f0f6fc"
         fplt.background = "#0d1117"
 
@@ -177,6 +275,14 @@ class FinplotActor(Actor):
         # self._timer.timeout.connect(self._refresh_chart)
         # self._timer.start(100)  # 100ms refresh rate for smooth updates
 
+        # Topic-specific subscriptions: the MessageBus dispatches bars straight
+        # to on_bar and funding events to on_data, so no per-event isinstance
+        # discrimination is needed in the hot path
+        if self._bar_type is not None:
+            self.subscribe_bars(self._bar_type)
+        if FundingPaymentEvent is not None:
+            self.subscribe_data(DataType(FundingPaymentEvent))
+
         self.log.info("FinplotActor started (backtest mode - chart creation skipped)")
         console.print(
             "[blue]🚀 FinplotActor started - backtest mode "
@@ -190,51 +296,67 @@ class FinplotActor(Actor):
         self.log.info("FinplotActor stopped")
         console.print("[yellow]⏹️ FinplotActor stopped[/yellow]")
 
+    def _append_bar(self, ts: float, o: float, c: float, h: float, low: float, v: float) -> None:
+        """Append one bar to the columnar buffers, doubling capacity when full."""
+        n = self._ohlc_n
+        if n == self._ohlc_capacity:
+            self._grow_buffers()
+        self._ohlc_ts[n] = ts
+        self._ohlc_o[n] = o
+        self._ohlc_c[n] = c
+        self._ohlc_h[n] = h
+        self._ohlc_l[n] = low
+        self._ohlc_v[n] = v
+        self._ohlc_n = n + 1
+        self._dirty = True
+
+    def _grow_buffers(self) -> None:
+        """Double the columnar buffer capacity, preserving buffered rows."""
+        new_capacity = self._ohlc_capacity * 2
+        for name in ("_ohlc_ts", "_ohlc_o", "_ohlc_c", "_ohlc_h", "_ohlc_l", "_ohlc_v"):
+            buf = getattr(self, name)
+            grown = np.empty(new_capacity, dtype=np.float64)
+            grown[:self._ohlc_n] = buf[:self._ohlc_n]
+            setattr(self, name, grown)
+        self._ohlc_capacity = new_capacity
+
     def on_reset(self) -> None:
         """Called when the actor resets."""
-        self._ohlc_buffer.clear()
-        self._volume_buffer.clear()
+        self._ohlc_n = 0
         self._funding_events.clear()
+        self._candle_item = None
+        self._volume_item = None
+        self._dirty = False
         self.log.info("FinplotActor reset")
         console.print("[blue]🔄 FinplotActor reset[/blue]")
 
+    def on_bar(self, bar: Bar) -> None:
+        """Handle bars dispatched directly by the MessageBus subscription."""
+        # Convert each Price/Quantity to float exactly once
+        self._append_bar(
+            bar.ts_event / 1e9,
+            float(bar.open),
+            float(bar.close),
+            float(bar.high),
+            float(bar.low),
+            float(bar.volume),
+        )
+
     def on_data(self, data) -> None:
         """
-        Handle incoming data using native patterns.
+        Handle subscribed custom data (funding payment events).
 
-        This method receives all data types through MessageBus.
-        Following NautilusTrader_FINPLOT_INTEGRATION.md guidelines.
+        Bars go straight to on_bar via subscribe_bars, so only the funding
+        subscription routes through here.
         """
-        # Handle Bar data (OHLCV)
-        if hasattr(data, "open") and hasattr(data, "close"):  # Bar-like data
-            # Convert nanosecond timestamp to datetime (native pattern)
-            timestamp = data.ts_event / 1e9
-
-            self._ohlc_buffer.append({
-                "timestamp": timestamp,
-                "open": float(data.open),
-                "close": float(data.close),
-                "high": float(data.high),
-                "low": float(data.low),
-            })
-
-            if hasattr(data, "volume"):
-                self._volume_buffer.append({
-                    "timestamp": timestamp,
-                    "open": float(data.open),
-                    "close": float(data.close),
-                    "volume": float(data.volume),
-                })
-
-        # Handle Funding events (if available)
-        from nautilus_test.funding.data import FundingPaymentEvent
-        if isinstance(data, FundingPaymentEvent):
+        if FundingPaymentEvent is not None and isinstance(data, FundingPaymentEvent):
             timestamp = data.ts_event / 1e9
             self._funding_events.append({
                 "timestamp": timestamp,
                 "amount": float(data.payment_amount),
                 "is_payment": data.is_payment,
             })
+            self._dirty = True
 
             console.print(
                 f"[cyan]📊 Chart: Funding {'payment' if data.is_payment else 'receipt'} "
@@ -252,34 +374,36 @@ class FinplotActor(Actor):
         if self._ax is None or self._ax2 is None:
             return
 
-        # Update OHLC chart
-        if self._ohlc_buffer:
-            df_ohlc = pd.DataFrame(self._ohlc_buffer)
-
-            # Clear and replot (efficient for real-time updates)
-            if self._ax:
-                self._ax.clear()
-            fplt.candlestick_ochl(
-                df_ohlc[["open", "close", "high", "low"]],
-                ax=self._ax,
-            )
-
-            # Clear buffer after plotting
-            self._ohlc_buffer.clear()
-
-        # Update volume chart
-        if self._volume_buffer:
-            df_vol = pd.DataFrame(self._volume_buffer)
+        # Skip the frame entirely unless new events arrived since last render
+        if not self._dirty:
+            return
 
-            if self._ax2:
-                self._ax2.clear()
-            fplt.volume_ocv(
-                df_vol[["open", "close", "volume"]],
-                ax=self._ax2,
-            )
+        _load_finplot()
+
+        # Update OHLC and volume charts from the columnar buffers - the dict
+        # constructor wraps the existing arrays without copying
+        n = self._ohlc_n
+        if n:
+            df_ohlc = pd.DataFrame({
+                "open": self._ohlc_o[:n],
+                "close": self._ohlc_c[:n],
+                "high": self._ohlc_h[:n],
+                "low": self._ohlc_l[:n],
+            })
+            df_vol = pd.DataFrame({
+                "open": self._ohlc_o[:n],
+                "close": self._ohlc_c[:n],
+                "volume": self._ohlc_v[:n],
+            })
 
-            # Clear buffer after plotting
-            self._volume_buffer.clear()
+            # Create the plot items once, then push incremental updates - a
+            # clear+replot re-uploads every accumulated candle per frame
+            if self._candle_item is None:
+                self._candle_item = fplt.candlestick_ochl(df_ohlc, ax=self._ax)
+                self._volume_item = fplt.volume_ocv(df_vol, ax=self._ax2)
+            else:
+                self._candle_item.update_data(df_ohlc)
+                self._volume_item.update_data(df_vol)
 
         # Add funding event markers if any
         if self._funding_events:
@@ -297,6 +421,112 @@ class FinplotActor(Actor):
 
             self._funding_events.clear()
 
+        self._dirty = False
+
+
+# Integer regime codes used by the JIT kernels (strings only for display)
+REGIME_VOLATILE = 0
+REGIME_TRENDING = 1
+REGIME_RANGING = 2
+REGIME_UNKNOWN = 3
+
+REGIME_NAMES = ("VOLATILE", "TRENDING", "RANGING", "UNKNOWN")
+
+# Max position hold time in bars, indexed by regime code (15min/1h/30min/45min)
+_MAX_HOLD = np.array([15, 60, 30, 45], dtype=np.int32)
+
+# Integer direction codes used throughout the signal path - integer compares
+# are a handful of opcodes vs string interning/equality, and keep the kernels
+# nopython-compatible. Strings appear only in log output and order mapping.
+DIR_BUY = 1
+DIR_SELL = -1
+DIR_NONE = 0
+
+_DIRECTION_NAMES = {DIR_BUY: "BUY", DIR_SELL: "SELL", DIR_NONE: "NONE"}
+_SIDE_MAP = {DIR_BUY: OrderSide.BUY, DIR_SELL: OrderSide.SELL}
+
+
+@njit(cache=True)
+def _percentile_partition(values, q):
+    """O(n) percentile via introselect instead of a full O(n log n) sort.
+
+    Skips np.percentile's interpolation path - the self-calibrating
+    thresholds only need a rank statistic, not interpolated quantiles.
+    """
+    k = int(q * (values.shape[0] - 1) / 100.0)
+    return np.partition(values, k)[k]
+
+
+@njit(cache=True)
+def detect_regime_kernel(
+    recent_returns,
+    recent_volatilities,
+    recent_volumes,
+    current_return,
+    current_volatility,
+    current_volume,
+):
+    """Classify the market regime, returning (regime_code, confidence)."""
+    trend_threshold = _percentile_partition(np.abs(recent_returns), 40)  # Much more responsive
+    volatility_threshold = _percentile_partition(recent_volatilities, 85)  # Very lenient
+    volume_threshold = _percentile_partition(recent_volumes, 30)  # Very responsive
+
+    # Regime logic (more balanced)
+    if current_volatility > volatility_threshold * 1.5:  # Less restrictive
+        return REGIME_VOLATILE, min(current_volatility / volatility_threshold, 2.0)
+    if current_return > trend_threshold and current_volume > volume_threshold * 0.8:  # More flexible
+        return REGIME_TRENDING, min(current_return / trend_threshold, 2.0)
+    return REGIME_RANGING, 1.0 - min(current_return / trend_threshold, 1.0)
+
+
+@njit(cache=True)
+def trending_signal_kernel(short_momentum, medium_momentum):
+    """Momentum signal from precomputed window means, returning (direction, strength)."""
+    # Require consistent momentum (much more responsive)
+    if (short_momentum > 0 and medium_momentum > 0 and
+            short_momentum > medium_momentum * 1.05):  # Very lenient
+        return 1, min(abs(short_momentum) * 50, 1.0)  # Very sensitive
+    if (short_momentum < 0 and medium_momentum < 0 and
+            short_momentum < medium_momentum * 1.05):  # Very lenient
+        return -1, min(abs(short_momentum) * 50, 1.0)  # Very sensitive
+    return 0, 0.0
+
+
+@njit(cache=True)
+def ranging_signal_kernel(current_price, mean_price, std_price):
+    """Mean-reversion signal from precomputed window stats, returning (direction, strength)."""
+    if std_price == 0:
+        return 0, 0.0
+
+    z_score = (current_price - mean_price) / std_price
+
+    # Mean reversion at extremes (very responsive)
+    if z_score > 0.2:  # Very low threshold for realistic trading
+        return -1, min(abs(z_score), 1.0)
+    if z_score < -0.2:  # Very low threshold for realistic trading
+        return 1, min(abs(z_score), 1.0)
+    return 0, 0.0
+
+
+_KERNELS_WARM = False
+
+
+def warmup_numba_kernels() -> None:
+    """Compile (or load from Numba's on-disk cache) all numeric kernels once.
+
+    With cache=True the machine code persists across processes, so repeated
+    backtest runs and parameter sweeps only pay a cache load, not a compile.
+    Safe to call multiple times - compilation happens once per process.
+    """
+    global _KERNELS_WARM
+    if _KERNELS_WARM:
+        return
+    dummy = np.ones(50, dtype=np.float64)
+    detect_regime_kernel(dummy, dummy[:20], dummy, 1.0, 1.0, 1.0)
+    trending_signal_kernel(0.0, 0.0)
+    ranging_signal_kernel(1.0, 1.0, 1.0)
+    _KERNELS_WARM = True
+
 
 class AdaptiveProfitableStrategy(Strategy):
     """
@@ -304,17 +534,29 @@ class AdaptiveProfitableStrategy(Strategy):
     Integrates seamlessly with existing DSM hybrid integration system.
     """
 
+    # Rolling window capacity (mirrors the previous 500-element list trim)
+    WINDOW = 500
+
     def __init__(self, config):
         super().__init__(config)
-        
-        # Core data for regime detection
-        self.prices = []
-        self.volumes = []
-        self.returns = []
-        self.volatilities = []
-        
+
+        # Core data for regime detection, laid out as a single SoA ring
+        # buffer: one row per bar, columns = (price, volume, return,
+        # volatility). The per-bar write touches one contiguous row and the
+        # windowed reads are strided column views of the same block.
+        self._state = np.empty((self.WINDOW, 4), dtype=np.float64)
+        self._prices = self._state[:, 0]
+        self._volumes = self._state[:, 1]
+        self._returns = self._state[:, 2]
+        self._volatilities = self._state[:, 3]
+        self._n_prices = 0
+        self._n_volumes = 0
+        self._n_returns = 0
+        self._n_vols = 0
+
         # Market regime state
         self.current_regime = "UNKNOWN"
+        self.current_regime_code = REGIME_UNKNOWN
         self.regime_confidence = 0.0
         self.last_regime_change = 0
         
@@ -322,6 +564,11 @@ class AdaptiveProfitableStrategy(Strategy):
         self.position_hold_bars = 0
         self.last_trade_bar = 0
         self.cooldown_period = 5  # Bars between trades (more responsive)
+
+        # Local position-side mirror (+1 long, -1 short, 0 flat), maintained
+        # from position events so the per-bar paths avoid crossing into the
+        # portfolio's Cython position scan
+        self._position_side = 0
         
         # Performance tracking
         self.total_signals = 0
@@ -332,7 +579,26 @@ class AdaptiveProfitableStrategy(Strategy):
         self.consecutive_losses = 0
         self.consecutive_wins = 0
         self.dynamic_risk_multiplier = 1.0
-        
+
+        # Debug output gating - per-bar stdout writes are one of the slowest
+        # operations in the backtest loop, so they default to off
+        self._debug = bool(getattr(config, "debug_prints", False))
+        self._debug_every = 100
+
+        # Running window sums, updated in O(1) per bar (add the new value,
+        # subtract the value falling out of the window) so the signal paths
+        # read precomputed means instead of reducing a slice every bar
+        self._ret_sum5 = 0.0
+        self._ret_sum12 = 0.0
+        self._ret_sum20 = 0.0
+        self._ret_sumsq20 = 0.0
+        self._price_sum40 = 0.0
+        self._price_sumsq40 = 0.0
+
+        # Quantity objects keyed by size in milli-BTC (orders reuse the same
+        # rounded notional, so construction cost is paid once per size)
+        self._quantity_cache: dict[int, Quantity] = {}
+
         console.print("[green]✅ AdaptiveProfitableStrategy initialized[/green]")
         print("🚀 STRATEGY INIT: AdaptiveProfitableStrategy ready for bars")
         print(f"📊 CONFIG: bar_type={config.bar_type}, instrument={config.instrument_id}")
@@ -342,7 +608,11 @@ class AdaptiveProfitableStrategy(Strategy):
         self.log.info("AdaptiveProfitableStrategy started")
         console.print("[blue]🚀 AdaptiveProfitableStrategy started[/blue]")
         print("🚀 STRATEGY START: Ready to receive bars")
-        
+
+        # Pay Numba JIT compilation cost before the first real bar; repeated
+        # runs after reset() skip it entirely
+        warmup_numba_kernels()
+
         # CRITICAL: Subscribe to bars - this was missing!
         self.subscribe_bars(self.config.bar_type)
         print(f"📊 SUBSCRIBED to bar_type: {self.config.bar_type}")
@@ -350,225 +620,270 @@ class AdaptiveProfitableStrategy(Strategy):
 
     def on_bar(self, bar: Bar):
         """Enhanced bar processing with regime detection and quality filtering."""
-        current_bar = len(self.prices)
-        
-        # Simple debug - just print every bar
-        print(f"📊 BAR #{current_bar}: {bar.close} vol={bar.volume}")
-        
-        # Log first few bars for debugging
-        if current_bar < 5:
-            console.print(f"[green]📊 Received BAR #{current_bar}: {bar.close} vol={bar.volume}[/green]")
-        
+        current_bar = self._n_prices
+
+        # Rate-limited debug output (formatting only runs when enabled, so the
+        # Decimal->str conversions never happen in production runs)
+        if self._debug and current_bar % self._debug_every == 0:
+            print(f"📊 BAR #{current_bar}: {bar.close} vol={bar.volume}")
+
         # Update data
         self._update_data(bar)
-        
+
         # Need minimum data for regime detection
-        if len(self.prices) < 50:
+        if self._n_prices < 50:
             return
-            
+
         # Detect market regime
         self._detect_regime(current_bar)
-        
+
         # Process trading signals
         self._process_enhanced_signals(bar, current_bar)
-        
+
         # Manage position
         self._manage_position()
 
+    def _push(self, buf: np.ndarray, n: int, value: float) -> int:
+        """Store value in the ring buffer and return the new element count."""
+        buf[n % self.WINDOW] = value
+        return n + 1
+
+    def _recent(self, buf: np.ndarray, n: int, k: int) -> np.ndarray:
+        """Return the last k values pushed into the ring buffer.
+
+        Returns a zero-copy contiguous view when the window does not wrap,
+        otherwise a stitched copy of the two wrapped segments.
+        """
+        k = min(k, n, self.WINDOW)
+        end = n % self.WINDOW
+        start = end - k
+        if start >= 0:
+            return buf[start:end]
+        return np.concatenate((buf[start:], buf[:end]))
+
+    def _last(self, buf: np.ndarray, n: int) -> float:
+        """Return the most recent value pushed into the ring buffer."""
+        return buf[(n - 1) % self.WINDOW]
+
+    def history_as_arrow(self):
+        """Return the buffered history as a ``pyarrow.RecordBatch``.
+
+        The batch wraps the SoA ring buffer's valid region - a zero-copy view
+        while the window has not wrapped, a stitched copy afterwards - so
+        post-backtest visualization can hand the columns to pandas/polars
+        without rebuilding them from Python lists.
+        """
+        if pa is None:
+            raise ImportError("pyarrow is required for history_as_arrow()")
+
+        # Align on the shortest column so all arrays share one length
+        k = min(self._n_prices, self._n_volumes, self._n_returns, self._n_vols, self.WINDOW)
+        return pa.RecordBatch.from_arrays(
+            [
+                pa.array(np.ascontiguousarray(self._recent(self._prices, self._n_prices, k))),
+                pa.array(np.ascontiguousarray(self._recent(self._volumes, self._n_volumes, k))),
+                pa.array(np.ascontiguousarray(self._recent(self._returns, self._n_returns, k))),
+                pa.array(np.ascontiguousarray(self._recent(self._volatilities, self._n_vols, k))),
+            ],
+            names=["price", "volume", "return", "volatility"],
+        )
+
     def _update_data(self, bar: Bar):
         """Update price and volume data."""
         price = float(bar.close)
         volume = float(bar.volume)
-        
-        self.prices.append(price)
-        self.volumes.append(volume)
-        
-        # Calculate returns
-        if len(self.prices) >= 2:
-            ret = (price - self.prices[-2]) / self.prices[-2]
-            self.returns.append(ret)
-            
-        # Calculate volatility
-        if len(self.returns) >= 20:
-            recent_returns = self.returns[-20:]
-            volatility = np.std(recent_returns)
-            self.volatilities.append(volatility)
-            
-        # Keep recent data only
-        if len(self.prices) > 500:
-            self.prices = self.prices[-500:]
-            self.volumes = self.volumes[-500:]
-            self.returns = self.returns[-500:]
-            self.volatilities = self.volatilities[-500:]
+
+        # Calculate returns (needs previous price before pushing the new one)
+        if self._n_prices >= 1:
+            prev_price = self._last(self._prices, self._n_prices)
+            ret = (price - prev_price) / prev_price
+            n_ret = self._n_returns
+            self._n_returns = self._push(self._returns, self._n_returns, ret)
+
+            # O(1) running momentum sums (outgoing values are still resident
+            # in the ring buffer since the windows are far below WINDOW)
+            self._ret_sum5 += ret
+            self._ret_sum12 += ret
+            self._ret_sum20 += ret
+            self._ret_sumsq20 += ret * ret
+            if n_ret >= 5:
+                self._ret_sum5 -= self._returns[(n_ret - 5) % self.WINDOW]
+            if n_ret >= 12:
+                self._ret_sum12 -= self._returns[(n_ret - 12) % self.WINDOW]
+            if n_ret >= 20:
+                out_ret = self._returns[(n_ret - 20) % self.WINDOW]
+                self._ret_sum20 -= out_ret
+                self._ret_sumsq20 -= out_ret * out_ret
+
+        n_price = self._n_prices
+        self._n_prices = self._push(self._prices, self._n_prices, price)
+        self._n_volumes = self._push(self._volumes, self._n_volumes, volume)
+
+        # Running 40-bar price sum and sum of squares for the ranging signal
+        self._price_sum40 += price
+        self._price_sumsq40 += price * price
+        if n_price >= 40:
+            out_price = self._prices[(n_price - 40) % self.WINDOW]
+            self._price_sum40 -= out_price
+            self._price_sumsq40 -= out_price * out_price
+
+        # Calculate volatility from the running 20-return sum / sum of squares
+        # instead of re-reducing the slice with np.std each bar; clamp the
+        # variance at zero to absorb floating-point cancellation
+        if self._n_returns >= 20:
+            mean_ret = self._ret_sum20 / 20.0
+            var = self._ret_sumsq20 / 20.0 - mean_ret * mean_ret
+            volatility = math.sqrt(var) if var > 0.0 else 0.0
+            self._n_vols = self._push(self._volatilities, self._n_vols, volatility)
 
     def _detect_regime(self, current_bar: int):
         """Detect market regime without magic numbers."""
-        if len(self.returns) < 30 or len(self.volatilities) < 10:
+        if self._n_returns < 30 or self._n_vols < 10:
             return
-            
+
         # Self-calibrating thresholds (highly responsive)
-        recent_returns = self.returns[-50:]
-        recent_volatilities = self.volatilities[-20:]
-        recent_volumes = self.volumes[-50:]
-        
-        trend_threshold = np.percentile(np.abs(recent_returns), 40)  # Much more responsive
-        volatility_threshold = np.percentile(recent_volatilities, 85)  # Very lenient
-        volume_threshold = np.percentile(recent_volumes, 30)  # Very responsive
-        
-        # Current conditions
-        current_return = abs(self.returns[-1])
-        current_volatility = self.volatilities[-1]
-        current_volume = self.volumes[-1]
-        
-        # Regime logic (more balanced)
-        if current_volatility > volatility_threshold * 1.5:  # Less restrictive
-            new_regime = "VOLATILE"
-            confidence = min(current_volatility / volatility_threshold, 2.0)
-        elif current_return > trend_threshold and current_volume > volume_threshold * 0.8:  # More flexible
-            new_regime = "TRENDING"
-            confidence = min(current_return / trend_threshold, 2.0)
-        else:
-            new_regime = "RANGING"
-            confidence = 1.0 - min(current_return / trend_threshold, 1.0)
-            
+        recent_returns = self._recent(self._returns, self._n_returns, 50)
+        recent_volatilities = self._recent(self._volatilities, self._n_vols, 20)
+        recent_volumes = self._recent(self._volumes, self._n_volumes, 50)
+
+        regime_code, confidence = detect_regime_kernel(
+            recent_returns,
+            recent_volatilities,
+            recent_volumes,
+            abs(self._last(self._returns, self._n_returns)),
+            self._last(self._volatilities, self._n_vols),
+            self._last(self._volumes, self._n_volumes),
+        )
+        new_regime = REGIME_NAMES[regime_code]
+
         # Update regime
         if new_regime != self.current_regime:
             console.print(f"[yellow]📊 Regime change: {self.current_regime} → {new_regime}[/yellow]")
             self.last_regime_change = current_bar
-            
+
         self.current_regime = new_regime
+        self.current_regime_code = regime_code
         self.regime_confidence = confidence
 
     def _process_enhanced_signals(self, bar: Bar, current_bar: int):
         """Process trading signals with quality filtering."""
-        # Debug: Track signal processing
-        if current_bar % 100 == 0:  # Every 100 bars
-            console.print(f"[cyan]🔍 DEBUG Bar {current_bar}: Regime={self.current_regime}, Total signals={self.total_signals}, Traded={self.traded_signals}[/cyan]")
-            print(f"🔍 PROGRESS: Bar {current_bar}/1980 processed")
-        
-        # Adaptive cooldown period (self-calibrating)
-        adaptive_cooldown = max(3, self.cooldown_period - self.consecutive_wins)  # Reduce cooldown with wins
+        # Integer guards come first so the common "skip this bar" path returns
+        # before any debug formatting or signal work happens
+
+        # Adaptive cooldown period (self-calibrating, shrinks with wins)
+        adaptive_cooldown = self.cooldown_period - self.consecutive_wins
+        if adaptive_cooldown < 3:
+            adaptive_cooldown = 3
         if current_bar - self.last_trade_bar < adaptive_cooldown:
             return
-            
+
         # Don't trade immediately after regime change (reduced restriction)
         if current_bar - self.last_regime_change < 3:
             return
-            
-        # Don't trade in volatile markets
-        if self.current_regime == "VOLATILE":
-            if current_bar % 200 == 0:  # Debug volatile regime
-                console.print("[red]⚠️ DEBUG: Skipping trade - VOLATILE regime[/red]")
+
+        # Don't trade in volatile markets (integer regime compare)
+        if self.current_regime_code == REGIME_VOLATILE:
+            if self._debug and current_bar % 200 == 0:
+                self.log.debug("Skipping trade - VOLATILE regime")
             return
-            
+
+        # Debug: Track signal processing (plain strings through the Nautilus
+        # logger - no Rich markup parsing or ANSI rendering per bar, and the
+        # log level filters them out entirely in production)
+        if self._debug and current_bar % self._debug_every == 0:
+            self.log.debug(
+                f"Bar {current_bar}: regime={self.current_regime}, "
+                f"total_signals={self.total_signals}, traded={self.traded_signals}",
+            )
+
         # Generate signal based on regime
         signal_direction, signal_strength = self._generate_regime_signal()
-        
-        if signal_direction == "NONE":
-            if current_bar % 200 == 0:  # Debug no signal
-                console.print(f"[yellow]⚠️ DEBUG: No signal generated - Regime={self.current_regime}[/yellow]")
+
+        if signal_direction == DIR_NONE:
+            if self._debug and current_bar % 200 == 0:
+                self.log.debug(f"No signal generated - regime={self.current_regime}")
             return
-            
+
         self.total_signals += 1
-        console.print(f"[green]📊 Signal generated: {signal_direction} strength={signal_strength:.3f} (regime: {self.current_regime}) @ {bar.close}[/green]")
-        
+        self.log.debug(
+            f"Signal generated: {_DIRECTION_NAMES[signal_direction]} "
+            f"strength={signal_strength:.3f} (regime: {self.current_regime}) @ {bar.close}",
+        )
+
         # Quality filtering
         if not self._is_high_quality_signal(signal_direction, signal_strength):
-            console.print("[red]❌ Signal rejected: Low quality[/red]")
+            self.log.debug("Signal rejected: low quality")
             return
-            
+
         # Risk management check
         if not self._risk_management_check():
-            console.print("[red]❌ Signal rejected: Risk management[/red]")
+            self.log.debug("Signal rejected: risk management")
             return
-            
+
         # Execute trade
-        console.print(f"[green]💰 Executing trade: {signal_direction} @ {bar.close}[/green]")
+        self.log.debug(f"Executing trade: {_DIRECTION_NAMES[signal_direction]} @ {bar.close}")
         self._execute_enhanced_trade(signal_direction, bar)
         self.traded_signals += 1
         self.last_trade_bar = current_bar
 
     def _generate_regime_signal(self):
-        """Generate signal based on current regime."""
+        """Generate (direction_code, strength) based on current regime."""
         if self.current_regime == "TRENDING":
             return self._trending_signal()
         elif self.current_regime == "RANGING":
             return self._ranging_signal()
         else:
-            return "NONE", 0.0
+            return DIR_NONE, 0.0
 
     def _trending_signal(self):
         """Momentum-based signal for trending markets."""
-        if len(self.returns) < 20:
-            return "NONE", 0.0
-            
-        # Multi-timeframe momentum
-        short_momentum = np.mean(self.returns[-5:])
-        medium_momentum = np.mean(self.returns[-12:])
-        long_momentum = np.mean(self.returns[-20:])
-        
-        # Require consistent momentum (much more responsive)
-        if (short_momentum > 0 and medium_momentum > 0 and 
-            short_momentum > medium_momentum * 1.05):  # Very lenient
-            strength = min(abs(short_momentum) * 50, 1.0)  # Very sensitive
-            return "BUY", strength
-            
-        elif (short_momentum < 0 and medium_momentum < 0 and 
-              short_momentum < medium_momentum * 1.05):  # Very lenient
-            strength = min(abs(short_momentum) * 50, 1.0)  # Very sensitive
-            return "SELL", strength
-            
-        return "NONE", 0.0
+        if self._n_returns < 20:
+            return DIR_NONE, 0.0
+
+        # Multi-timeframe momentum from the O(1) running sums
+        return trending_signal_kernel(
+            self._ret_sum5 / 5.0,
+            self._ret_sum12 / 12.0,
+        )
 
     def _ranging_signal(self):
         """Mean reversion signal for ranging markets."""
-        if len(self.prices) < 40:
-            return "NONE", 0.0
-            
-        # Adaptive bollinger-like bands
-        recent_prices = self.prices[-40:]
-        mean_price = np.mean(recent_prices)
-        std_price = np.std(recent_prices)
-        
-        if std_price == 0:
-            return "NONE", 0.0
-            
-        current_price = self.prices[-1]
-        z_score = (current_price - mean_price) / std_price
-        
-        # Mean reversion at extremes (very responsive)
-        if z_score > 0.2:  # Very low threshold for realistic trading
-            strength = min(abs(z_score) / 1.0, 1.0)
-            return "SELL", strength
-        elif z_score < -0.2:  # Very low threshold for realistic trading
-            strength = min(abs(z_score) / 1.0, 1.0)
-            return "BUY", strength
-            
-        return "NONE", 0.0
+        if self._n_prices < 40:
+            return DIR_NONE, 0.0
+
+        # Adaptive bollinger-like bands from the running sum / sum of squares
+        # (variance clamped at zero against catastrophic cancellation)
+        mean_price = self._price_sum40 / 40.0
+        variance = max(self._price_sumsq40 / 40.0 - mean_price * mean_price, 0.0)
+        return ranging_signal_kernel(
+            self._last(self._prices, self._n_prices),
+            mean_price,
+            math.sqrt(variance),
+        )
 
-    def _is_high_quality_signal(self, direction: str, strength: float) -> bool:
+    def _is_high_quality_signal(self, direction: int, strength: float) -> bool:
         """Filter for high-quality signals only."""
         # Minimum strength threshold (very lenient)
         if strength < 0.1:  # Much lower threshold
             return False
             
         # Volume confirmation (more flexible)
-        if len(self.volumes) >= 20:
-            recent_avg_volume = np.mean(self.volumes[-20:])
-            current_volume = self.volumes[-1]
+        if self._n_volumes >= 20:
+            recent_avg_volume = np.mean(self._recent(self._volumes, self._n_volumes, 20))
+            current_volume = self._last(self._volumes, self._n_volumes)
             if current_volume < recent_avg_volume * 0.6:  # More lenient
                 return False
-                
+
         # Trend consistency for trending signals (more flexible)
         if self.current_regime == "TRENDING":
-            if len(self.returns) >= 10:
-                recent_returns = self.returns[-10:]
-                if direction == "BUY":
-                    positive_returns = sum(1 for r in recent_returns if r > 0)
+            if self._n_returns >= 10:
+                recent_returns = self._recent(self._returns, self._n_returns, 10)
+                if direction == DIR_BUY:
+                    positive_returns = np.count_nonzero(recent_returns > 0)
                     if positive_returns < 5:  # At least 50% positive (more lenient)
                         return False
                 else:  # SELL
-                    negative_returns = sum(1 for r in recent_returns if r < 0)
+                    negative_returns = np.count_nonzero(recent_returns < 0)
                     if negative_returns < 5:  # At least 50% negative (more lenient)
                         return False
                         
@@ -588,17 +903,16 @@ class AdaptiveProfitableStrategy(Strategy):
             
         return True
 
-    def _execute_enhanced_trade(self, direction: str, bar: Bar):
+    def _execute_enhanced_trade(self, direction: int, bar: Bar):
         """Execute trade with enhanced risk management."""
         # Close opposite position first
-        if not self.portfolio.is_flat(self.config.instrument_id):
-            if ((direction == "BUY" and self.portfolio.is_net_short(self.config.instrument_id)) or
-                (direction == "SELL" and self.portfolio.is_net_long(self.config.instrument_id))):
+        if self._position_side != 0:
+            if ((direction == DIR_BUY and self._position_side == -1) or
+                    (direction == DIR_SELL and self._position_side == 1)):
                 self._close_position()
                 return
-                
-        # Don't add to existing position
-        if not self.portfolio.is_flat(self.config.instrument_id):
+
+            # Don't add to existing position
             return
             
         # Calculate position size with risk adjustment
@@ -611,8 +925,16 @@ class AdaptiveProfitableStrategy(Strategy):
         actual_size = max(min_size, min(risk_adjusted_size, max_size))
         
         # Submit order using order factory (like EMA Cross)
-        side = OrderSide.BUY if direction == "BUY" else OrderSide.SELL
-        quantity = Quantity.from_str(f"{actual_size:.3f}")
+        side = _SIDE_MAP[direction]
+
+        # Fixed-point size keyed into a small cache - rounded sizes repeat
+        # across orders, and the numeric Quantity constructor avoids the
+        # float -> str -> Decimal round trip of Quantity.from_str
+        size_milli = int(round(actual_size * 1000))
+        quantity = self._quantity_cache.get(size_milli)
+        if quantity is None:
+            quantity = Quantity(size_milli / 1000.0, 3)
+            self._quantity_cache[size_milli] = quantity
         
         order = self.order_factory.market(
             instrument_id=self.config.instrument_id,
@@ -624,7 +946,10 @@ class AdaptiveProfitableStrategy(Strategy):
         self.submit_order(order)
         self.position_hold_bars = 0
         
-        console.print(f"[green]💰 Trade: {direction} {actual_size:.3f} BTC @ {bar.close} (regime: {self.current_regime})[/green]")
+        self.log.debug(
+            f"Trade: {_DIRECTION_NAMES[direction]} {actual_size:.3f} BTC "
+            f"@ {bar.close} (regime: {self.current_regime})",
+        )
 
     def _close_position(self):
         """Close current position using built-in method."""
@@ -633,16 +958,13 @@ class AdaptiveProfitableStrategy(Strategy):
 
     def _manage_position(self):
         """Enhanced position management."""
-        if not self.portfolio.is_flat(self.config.instrument_id):
+        if self._position_side != 0:
             self.position_hold_bars += 1
-            
-            # Max hold time varies by regime
-            max_hold = {
-                "TRENDING": 60,   # 1 hour
-                "RANGING": 30,    # 30 minutes
-                "VOLATILE": 15    # 15 minutes
-            }.get(self.current_regime, 45)
-            
+
+            # Max hold time varies by regime (array lookup by regime code -
+            # no per-bar dict construction or string hashing)
+            max_hold = _MAX_HOLD[self.current_regime_code]
+
             # Force close if held too long
             if self.position_hold_bars >= max_hold:
                 console.print(f"[yellow]⏰ Force closing position after {self.position_hold_bars} bars[/yellow]")
@@ -650,10 +972,14 @@ class AdaptiveProfitableStrategy(Strategy):
 
     def on_position_opened(self, position):
         """Track position opening."""
+        # The handler receives a PositionOpened event, which carries
+        # signed_qty rather than the Position.is_long convenience property
+        self._position_side = 1 if position.signed_qty > 0 else -1
         console.print(f"[blue]📈 Position opened: {position.side} {position.quantity} @ {position.avg_px_open}[/blue]")
 
     def on_position_closed(self, position):
         """Track position closing and update performance."""
+        self._position_side = 0
         realized_pnl = float(position.realized_pnl)
         
         # Update consecutive win/loss tracking
@@ -676,7 +1002,7 @@ class AdaptiveProfitableStrategy(Strategy):
         console.print("[yellow]⏹️ AdaptiveProfitableStrategy stopped[/yellow]")
         
         # Print final summary
-        print(f"🎯 FINAL SUMMARY: Processed {len(self.prices)} bars")
+        print(f"🎯 FINAL SUMMARY: Processed {self._n_prices} bars")
         print(f"📊 Generated {self.total_signals} signals, traded {self.traded_signals}")
         print(f"🏆 Signal efficiency: {(self.traded_signals/max(1,self.total_signals))*100:.1f}%")
         
@@ -696,10 +1022,16 @@ class AdaptiveProfitableStrategy(Strategy):
 
     def on_reset(self):
         """Reset strategy state."""
-        self.prices.clear()
-        self.volumes.clear()
-        self.returns.clear()
-        self.volatilities.clear()
+        self._n_prices = 0
+        self._n_volumes = 0
+        self._n_returns = 0
+        self._n_vols = 0
+        self._ret_sum5 = 0.0
+        self._ret_sum12 = 0.0
+        self._ret_sum20 = 0.0
+        self._ret_sumsq20 = 0.0
+        self._price_sum40 = 0.0
+        self._price_sumsq40 = 0.0
         self.total_signals = 0
         self.traded_signals = 0
         self.current_regime = "UNKNOWN"
@@ -707,6 +1039,8 @@ class AdaptiveProfitableStrategy(Strategy):
         self.last_regime_change = 0
         print("🔄 RESET: All strategy state cleared")
         self.current_regime = "UNKNOWN"
+        self.current_regime_code = REGIME_UNKNOWN
+        self._position_side = 0
         self.position_hold_bars = 0
         self.last_trade_bar = 0
         self.total_signals = 0
@@ -717,31 +1051,195 @@ class AdaptiveProfitableStrategy(Strategy):
         self.regime_performance = {"TRENDING": [], "RANGING": [], "VOLATILE": []}
 
 
+_PRICE_COLS = ("open", "high", "low", "close")
+
+# Pre-parsed quantizer for 3-decimal trade sizes
+_Q3 = Decimal("0.001")
+
+
+def _generate_synthetic_ohlcv(
+    count: int,
+    start_price: float,
+    rng: np.random.Generator,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Generate a synthetic OHLCV random walk as whole arrays.
+
+    One batched uniform draw per random stream and a cumprod price path -
+    the arrays come out ready for bar construction with no interpreter-level
+    per-bar math.
+    """
+    price_changes = rng.uniform(-0.002, 0.002, size=count)
+    path = start_price * np.cumprod(1.0 + price_changes)
+    opens = path * rng.uniform(0.999, 1.001, size=count)
+    closes = path * rng.uniform(0.999, 1.001, size=count)
+    highs = np.maximum(opens, closes) * rng.uniform(1.0, 1.002, size=count)
+    lows = np.minimum(opens, closes) * rng.uniform(0.998, 1.0, size=count)
+    volumes = rng.uniform(0.1, 2.0, size=count)
+    return opens, highs, lows, closes, volumes
+
+# Invariant instrument identity and margin/fee terms, parsed once at import
+# instead of per create_nautilus_instrument call
+_INSTRUMENT_ID = InstrumentId.from_str("BTCUSDT-PERP.SIM")
+_RAW_SYMBOL = Symbol("BTCUSDT")
+_MARGIN_INIT = Decimal("0.01")
+_MARGIN_MAINT = Decimal("0.005")
+_MAKER_FEE = Decimal("0.00012")  # Real Binance VIP 3: 0.012%
+_TAKER_FEE = Decimal("0.00032")  # Real Binance VIP 3: 0.032%
+
+# TIME SPAN 3: Late November 2024 (Autumn Period) - the one historical window
+# this script replays, defined once instead of re-spelled per call site
+TIME_SPAN_3_START = datetime(2024, 11, 20, 10, 0, 0)
+TIME_SPAN_3_END = datetime(2024, 11, 22, 10, 0, 0)
+
+# Base of the TIME_SPAN_3 fallback timestamp grid in integer nanoseconds -
+# the per-row fallback is then one add and one multiply instead of a datetime
+# construction per missing timestamp
+_HISTORICAL_BASE_NS = int(pd.Timestamp(TIME_SPAN_3_START).value)
+_NS_PER_MINUTE = 60_000_000_000
+
+
+def _round_polars(df, price_precision: int, size_precision: int):
+    """Round OHLCV columns of a Polars DataFrame in one with_columns pass."""
+    expressions = [pl.col(c).round(price_precision) for c in _PRICE_COLS if c in df.columns]
+    if "volume" in df.columns:
+        expressions.append(pl.col("volume").round(size_precision))
+    return df.with_columns(expressions) if expressions else df
+
+
+def _round_pandas(df, price_precision: int, size_precision: int):
+    """Round OHLCV columns of a Pandas DataFrame with one call per group."""
+    cols = [c for c in _PRICE_COLS if c in df.columns]
+    if cols:
+        df[cols] = df[cols].round(price_precision)
+    if "volume" in df.columns:
+        df["volume"] = df["volume"].round(size_precision)
+    return df
+
+
+def _round_ohlcv(df, price_precision: int, size_precision: int):
+    """Dispatch OHLCV rounding to the matching DataFrame backend."""
+    if pl is not None and isinstance(df, pl.DataFrame):
+        return _round_polars(df, price_precision, size_precision)
+    return _round_pandas(df, price_precision, size_precision)
+
+
+def _count_nulls_polars(df) -> tuple[int, dict]:
+    """Count nulls in a Polars frame; returns (total_nulls, audit details)."""
+    # One lazy plan, one execution: the per-column counts and the total both
+    # come from a single collected row
+    null_tbl = df.lazy().select(pl.all().null_count()).collect()
+    null_row = null_tbl.row(0)
+    per_column = dict(zip(null_tbl.columns, null_row, strict=False))
+    total = sum(null_row)
+    return total, {
+        "type": "Polars",
+        "columns": list(df.columns),
+        "null_counts_per_column": per_column,
+        "total_nulls": total,
+    }
+
+
+def _count_nulls_pandas(df) -> tuple[int, dict]:
+    """Count nulls in a pandas frame; returns (total_nulls, audit details)."""
+    null_counts = df.isna().sum()
+    per_column = null_counts.to_dict()
+    total = int(null_counts.sum())
+    return total, {
+        "type": "Pandas",
+        "columns": list(df.columns),
+        "null_counts_per_column": per_column,
+        "total_nulls": total,
+    }
+
+
+# Exact-type dispatch table for the data-quality check - one dict lookup per
+# frame instead of a chain of hasattr probes, and the counters stay free of
+# console I/O
+_NULL_VALIDATORS: dict[type, object] = {pd.DataFrame: _count_nulls_pandas}
+if pl is not None:
+    _NULL_VALIDATORS[pl.DataFrame] = _count_nulls_polars
+
+
 class BinanceSpecificationManager:
     """Manages real Binance specifications using python-binance."""
 
+    # Exchange filters (precisions, tick/step sizes) change rarely, so the
+    # symbol info payload is cached on disk for a day; ticker price and
+    # funding rate are always fetched live
+    _FILTERS_CACHE_TTL = 24 * 60 * 60
+
     def __init__(self):
         self.specs = None
         self.last_updated = None
 
+    def _filters_cache_path(self, symbol: str) -> Path | None:
+        """Return the on-disk cache path for a symbol's exchange filters."""
+        if cache_manager is None:
+            return None
+        return cache_manager.get_cache_dir("binance_specs") / f"{symbol}.json"
+
+    def _load_cached_symbol_info(self, symbol: str) -> dict | None:
+        """Load cached symbol info if present and younger than the TTL."""
+        path = self._filters_cache_path(symbol)
+        if path is None or not path.exists():
+            return None
+        if time.time() - path.stat().st_mtime >= self._FILTERS_CACHE_TTL:
+            return None
+        try:
+            return json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _get_symbol_info(self, client, symbol: str) -> dict:
+        """Return symbol info, preferring the on-disk cache over exchange-info.
+
+        The exchange-info payload is the heavy call (~MBs of filters), so it
+        is served from the TTL cache when warm.
+        """
+        symbol_info = self._load_cached_symbol_info(symbol)
+        if symbol_info is not None:
+            console.print("[cyan]📁 Using cached exchange filters (<24h old)[/cyan]")
+            return symbol_info
+        exchange_info = client.futures_exchange_info()
+        symbol_info = next(s for s in exchange_info["symbols"] if s["symbol"] == symbol)
+        self._store_cached_symbol_info(symbol, symbol_info)
+        return symbol_info
+
+    def _store_cached_symbol_info(self, symbol: str, symbol_info: dict) -> None:
+        """Persist symbol info so repeat runs skip the exchange-info fetch."""
+        path = self._filters_cache_path(symbol)
+        if path is None:
+            return
+        try:
+            path.write_text(json.dumps(symbol_info))
+        except OSError:
+            pass
+
     def fetch_btcusdt_perpetual_specs(self):
         """Fetch current BTCUSDT perpetual futures specifications."""
-        try:
-            from binance import Client
+        if Client is None:
+            console.print("[red]❌ python-binance not available - cannot fetch specs[/red]")
+            return False
 
+        try:
             console.print(
                 "[bold blue]🔍 Fetching Real Binance BTCUSDT-PERP "
                 "Specifications...[/bold blue]"
             )
 
             client = Client()
-            exchange_info = client.futures_exchange_info()
-            btc_symbol = next(s for s in exchange_info["symbols"] if s["symbol"] == "BTCUSDT")
-            filters = {f["filterType"]: f for f in btc_symbol["filters"]}
 
-            # Get current market data
-            ticker = client.futures_symbol_ticker(symbol="BTCUSDT")
-            funding = client.futures_funding_rate(symbol="BTCUSDT", limit=1)
+            # The three endpoints are independent, so overlap them on a small
+            # thread pool - cold-start wall time becomes the slowest call
+            # instead of the sum of all three
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                symbol_future = pool.submit(self._get_symbol_info, client, "BTCUSDT")
+                ticker_future = pool.submit(client.futures_symbol_ticker, symbol="BTCUSDT")
+                funding_future = pool.submit(client.futures_funding_rate, symbol="BTCUSDT", limit=1)
+                btc_symbol = symbol_future.result()
+                ticker = ticker_future.result()
+                funding = funding_future.result()
+            filters = {f["filterType"]: f for f in btc_symbol["filters"]}
 
             self.specs = {
                 "symbol": btc_symbol["symbol"],
@@ -800,8 +1298,8 @@ class BinanceSpecificationManager:
         console.print(comparison_table)
 
         instrument = CryptoPerpetual(
-            instrument_id=InstrumentId.from_str("BTCUSDT-PERP.SIM"),
-            raw_symbol=Symbol("BTCUSDT"),
+            instrument_id=_INSTRUMENT_ID,
+            raw_symbol=_RAW_SYMBOL,
             base_currency=BTC,
             quote_currency=USDT,
             settlement_currency=USDT,
@@ -817,10 +1315,10 @@ class BinanceSpecificationManager:
             min_notional=Money(float(self.specs["min_notional"]), USDT),
 
             # Conservative margin and REAL Binance VIP 3 fee estimates
-            margin_init=Decimal("0.01"),
-            margin_maint=Decimal("0.005"),
-            maker_fee=Decimal("0.00012"),  # Real Binance VIP 3: 0.012%
-            taker_fee=Decimal("0.00032"),  # Real Binance VIP 3: 0.032%
+            margin_init=_MARGIN_INIT,
+            margin_maint=_MARGIN_MAINT,
+            maker_fee=_MAKER_FEE,
+            taker_fee=_TAKER_FEE,
 
             ts_event=0,
             ts_init=0,
@@ -837,39 +1335,40 @@ class RealisticPositionSizer:
         self.specs = specs
         self.account_balance = account_balance
         self.max_risk_pct = max_risk_pct
+        # Parsed once so each sizing call quantizes straight onto the step
+        self._step = Decimal(str(specs["step_size"]))
 
     def calculate_position_size(self) -> dict:
         """Calculate realistic position size based on risk management."""
-        current_price = self.specs["current_price"]
-        min_qty = float(self.specs["min_qty"])
-        min_notional = float(self.specs["min_notional"])
+        # Exact Decimal arithmetic end to end: quantizing straight onto the
+        # step size replaces the float round/re-multiply dance and keeps the
+        # size-ratio and value-safety factors consistent (no float drift)
+        price = Decimal(str(self.specs["current_price"]))
+        min_qty = Decimal(str(self.specs["min_qty"]))
+        min_notional = Decimal(str(self.specs["min_notional"]))
+        balance = Decimal(str(self.account_balance))
 
         # Calculate maximum risk in USD
-        max_risk_usd = self.account_balance * self.max_risk_pct
-
-        # Calculate position size based on risk
-        position_size_btc = max_risk_usd / current_price
+        max_risk_usd = balance * Decimal(str(self.max_risk_pct))
 
-        # Round to step size
-        precision = len(self.specs["step_size"].split(".")[-1])
-        position_size_btc = round(position_size_btc, precision)
+        # Position size from risk, rounded down onto the step grid
+        position_size_btc = (max_risk_usd / price).quantize(self._step, rounding=ROUND_DOWN)
 
         # Ensure minimum requirements
         position_size_btc = max(position_size_btc, min_qty)
 
-        # Check minimum notional
-        notional_value = position_size_btc * current_price
-        if notional_value < min_notional:
-            position_size_btc = min_notional / current_price
-            position_size_btc = round(position_size_btc, precision)
+        # Check minimum notional - round up so the bumped size still clears it
+        if position_size_btc * price < min_notional:
+            position_size_btc = (min_notional / price).quantize(self._step, rounding=ROUND_UP)
 
+        notional_value = position_size_btc * price
         return {
-            "position_size_btc": position_size_btc,
-            "notional_value": position_size_btc * current_price,
-            "risk_percentage": (position_size_btc * current_price) / self.account_balance * 100,
+            "position_size_btc": float(position_size_btc),
+            "notional_value": float(notional_value),
+            "risk_percentage": float(notional_value / balance * 100),
             "meets_min_qty": position_size_btc >= min_qty,
-            "meets_min_notional": (position_size_btc * current_price) >= min_notional,
-            "max_risk_usd": max_risk_usd,
+            "meets_min_notional": notional_value >= min_notional,
+            "max_risk_usd": float(max_risk_usd),
         }
 
     def display_position_analysis(self):
@@ -883,35 +1382,26 @@ class RealisticPositionSizer:
         table.add_column("Safety Factor", style="cyan")
 
         # 🔧 CRITICAL FIX #4: Fix position sizing mathematical contradictions with validation
-        console.print("[yellow]🔍 DEBUG: Validating position sizing mathematics...[/yellow]")
+        log.debug("Validating position sizing mathematics")
 
         dangerous_1btc_value = 1.0 * self.specs["current_price"]
-        console.print(f"[blue]📊 DEBUG: Dangerous 1 BTC value: ${dangerous_1btc_value:,.2f}[/blue]")
-        console.print(
-            f"[blue]📊 DEBUG: Realistic position value: "
-            f"${calc['notional_value']:.2f}[/blue]"
-        )
+        log.debug("Dangerous 1 BTC value: $%.2f", dangerous_1btc_value)
+        log.debug("Realistic position value: $%.2f", calc["notional_value"])
 
         # Calculate consistent safety factors
         position_size_ratio = 1.0 / calc["position_size_btc"]  # How many times larger 1 BTC is
         # How many times safer realistic position is
         value_safety_factor = dangerous_1btc_value / calc["notional_value"]
 
-        console.print(
-            f"[cyan]🔍 DEBUG: Position size ratio: {position_size_ratio:.1f}x "
-            f"(1 BTC is {position_size_ratio:.1f}x larger)[/cyan]"
-        )
-        console.print(
-            f"[cyan]🔍 DEBUG: Value safety factor: {value_safety_factor:.1f}x "
-            f"(realistic position is {value_safety_factor:.1f}x safer)[/cyan]"
+        log.debug("Position size ratio: %.1fx (1 BTC is that much larger)", position_size_ratio)
+        log.debug(
+            "Value safety factor: %.1fx (realistic position is that much safer)",
+            value_safety_factor,
         )
 
         # 🚨 MATHEMATICAL VALIDATION: These should be approximately equal!
         ratio_difference = abs(position_size_ratio - value_safety_factor)
-        console.print(
-            f"[cyan]🧮 DEBUG: Safety factor consistency check: "
-            f"{ratio_difference:.1f} difference[/cyan]"
-        )
+        log.debug("Safety factor consistency check: %.1f difference", ratio_difference)
 
         if ratio_difference > 1.0:  # Allow for small rounding differences
             console.print("[red]🚨 WARNING: Inconsistent safety factors detected![/red]")
@@ -969,6 +1459,9 @@ class EnhancedModernBarDataProvider:
 
     def __init__(self, specs_manager: BinanceSpecificationManager):
         self.specs_manager = specs_manager
+        # Close prices of the most recent bar batch, kept so callers can
+        # run vectorized sanity checks without converting Price objects back
+        self._last_closes: np.ndarray | None = None
         if ArrowDataManager and DataPipeline:
             self.data_manager = ArrowDataManager()
             self.pipeline = DataPipeline(self.data_manager)
@@ -985,13 +1478,28 @@ class EnhancedModernBarDataProvider:
         bar_type: BarType,
         symbol: str = "BTCUSDT",
         limit: int = 500,
+        mode: str = "historical",
     ) -> list[Bar]:
-        """Fetch real market data with specification validation."""
+        """Fetch real market data with specification validation.
+
+        ``mode="historical"`` replays the fixed TIME_SPAN_3 window over the
+        REST batch pipeline, which is the right tool for an immutable date
+        range.  REST polling is the wrong architecture for live bars - that
+        path belongs to a WebSocket kline feed (e.g. ``btcusdt@kline_1m``)
+        delivering incremental bars with no DataFrame roundtrip - so
+        ``mode="live"`` is reserved and rejected here rather than silently
+        falling back to polling.
+        """
+        if mode != "historical":
+            raise NotImplementedError(
+                f"mode={mode!r} not supported: live bars should come from a "
+                "WebSocket kline feed, not REST polling",
+            )
         if self.has_dsm and self.data_manager:
             # Use real DSM pipeline
             return self._fetch_with_dsm(instrument, bar_type, symbol, limit)
         # Fallback to synthetic data with correct specifications
-        return self._create_synthetic_bars_with_real_specs(instrument, limit)
+        return self._create_synthetic_bars_with_real_specs(instrument, bar_type, limit)
 
     def _fetch_with_dsm(self, instrument, bar_type, symbol, limit):
         """Fetch data using FIXED DSM pipeline with real-time API fallback."""
@@ -1014,20 +1522,33 @@ class EnhancedModernBarDataProvider:
 
             # 🔍 CRITICAL FIX #5: Data source authentication and verification with audit trail
             if self.data_manager:
-                console.print(
-                    f"[yellow]🔍 DEBUG: Authenticating data source "
-                    f"for {symbol}...[/yellow]"
-                )
+                log.debug("Authenticating data source for %s", symbol)
 
                 # TIME SPAN 3: Late November 2024 (Autumn Period)
-                start_time = datetime(2024, 11, 20, 10, 0, 0)
-                end_time = datetime(2024, 11, 22, 10, 0, 0)
-
-                console.print(
-                    f"[blue]📅 DEBUG: Data fetch period: {start_time} "
-                    f"to {end_time}[/blue]"
+                start_time = TIME_SPAN_3_START
+                end_time = TIME_SPAN_3_END
+
+                log.debug("Data fetch period: %s to %s", start_time, end_time)
+                log.debug("Requesting %s data points for %s", limit, symbol)
+
+                # Historical data for a past window is immutable, so a keyed
+                # parquet hit skips the network fetch and the full validation
+                # pipeline on repeat runs
+                cache_key = (
+                    f"{symbol}_{start_time:%Y%m%d%H%M%S}_{end_time:%Y%m%d%H%M%S}_"
+                    f"{limit}_validated"
                 )
-                console.print(f"[blue]🎯 DEBUG: Requesting {limit} data points for {symbol}[/blue]")
+                cached_df = self.data_manager.load_from_parquet(cache_key)
+                if cached_df is not None and len(cached_df) > 0:
+                    console.print(
+                        f"[green]📁 Cache hit: {cache_key}.parquet - "
+                        f"skipping fetch and validation[/green]",
+                    )
+                    cache_path = self.data_manager.cache_dir / f"{cache_key}.parquet"
+                    progress.update(task, advance=3 * (limit // 4))
+                    return self._finalize_processed_df(
+                        cached_df, instrument, bar_type, symbol, cache_path, progress, task, limit,
+                    )
 
                 # Track data source authenticity
                 data_source_metadata = {
@@ -1040,10 +1561,7 @@ class EnhancedModernBarDataProvider:
                     "authentication_status": "ATTEMPTING",
                 }
 
-                console.print(
-                    f"[cyan]🔍 DEBUG: Data source metadata: "
-                    f"{data_source_metadata}[/cyan]"
-                )
+                log.debug("Data source metadata: %s", data_source_metadata)
 
                 # Fetch data with source verification - TIME SPAN 3
                 console.print(f"[bold yellow]🎯 TIME SPAN 3: Fetching data from {start_time} to {end_time}[/bold yellow]")
@@ -1051,25 +1569,18 @@ class EnhancedModernBarDataProvider:
                 df = self.data_manager.fetch_real_market_data(symbol, limit=limit, start_time=start_time, end_time=end_time)
 
                 # 🚨 CRITICAL: Verify data source authenticity
-                console.print("[yellow]🔍 DEBUG: Verifying data source authenticity...[/yellow]")
+                log.debug("Verifying data source authenticity")
 
                 # Check if data has source attribution
                 if hasattr(df, "attrs") and "data_source" in df.attrs:
-                    data_source = df.attrs["data_source"]
-                    console.print(
-                        f"[green]✅ DEBUG: Data source authenticated: "
-                        f"{data_source}[/green]"
-                    )
+                    log.debug("Data source authenticated: %s", df.attrs["data_source"])
                 elif hasattr(df, "columns") and "_data_source" in df.columns:
                     unique_sources = (
                         df["_data_source"].unique()
                         if hasattr(df, "unique")
                         else ["Unknown"]
                     )
-                    console.print(
-                        f"[green]✅ DEBUG: Data sources in dataset: "
-                        f"{list(unique_sources)}[/green]"
-                    )
+                    log.debug("Data sources in dataset: %s", list(unique_sources))
                 else:
                     console.print("[red]🚨 WARNING: No data source attribution found![/red]")
                     console.print(
@@ -1086,17 +1597,17 @@ class EnhancedModernBarDataProvider:
                     "data_type_received": type(df).__name__,
                 })
 
-                console.print(f"[cyan]📋 DEBUG: Updated data source metadata: {data_source_metadata}[/cyan]")
+                log.debug("Updated data source metadata: %s", data_source_metadata)
 
                 # Calculate start_time here if needed for logging
                 # start_time = datetime.now() - timedelta(days=2)
                 # end_time = start_time + timedelta(minutes=limit)
 
                 # 🔍 CRITICAL FIX #1: Proper data quality validation with debug logging
-                console.print("[yellow]🔍 DEBUG: Starting comprehensive data quality validation...[/yellow]")
+                log.debug("Starting comprehensive data quality validation")
 
                 total_rows = len(df)
-                console.print(f"[blue]📊 DEBUG: Total rows received: {total_rows}[/blue]")
+                log.debug("Total rows received: %s", total_rows)
 
                 # Enhanced data quality validation with detailed logging
                 nan_rows = 0
@@ -1104,28 +1615,19 @@ class EnhancedModernBarDataProvider:
                 validation_details = {}
 
                 try:
-                    if hasattr(df, "null_count"):  # Polars DataFrame
-                        data_type = "Polars"
-                        null_counts = df.null_count()
-                        console.print(f"[cyan]🔍 DEBUG: Polars null counts per column: {dict(zip(df.columns, null_counts.row(0), strict=False))}")
-                        nan_rows = null_counts.sum_horizontal().sum()
-                        validation_details = {
-                            "type": "Polars",
-                            "columns": list(df.columns),
-                            "null_counts_per_column": dict(zip(df.columns, null_counts.row(0), strict=False)),
-                            "total_nulls": nan_rows,
-                        }
-                    elif hasattr(df, "isna"):  # Pandas DataFrame
-                        data_type = "Pandas"
-                        null_counts_series = df.isna().sum()
-                        console.print(f"[cyan]🔍 DEBUG: Pandas null counts per column: {null_counts_series.to_dict()}")
-                        nan_rows = df.isna().any(axis=1).sum()
-                        validation_details = {
-                            "type": "Pandas",
-                            "columns": list(df.columns),
-                            "null_counts_per_column": null_counts_series.to_dict(),
-                            "total_rows_with_nulls": nan_rows,
-                        }
+                    # Single dict dispatch on the exact frame type; the
+                    # validators do one null-counting pass and no I/O.  With
+                    # the 100% completeness gate below, total nulls and
+                    # rows-with-nulls are both zero in the accepted case, so
+                    # the total stands in for the row count
+                    validator = _NULL_VALIDATORS.get(type(df))
+                    if validator is not None:
+                        nan_rows, validation_details = validator(df)
+                        data_type = validation_details["type"]
+                        log.debug(
+                            "%s null counts per column: %s",
+                            data_type, validation_details["null_counts_per_column"],
+                        )
                     else:
                         console.print(f"[red]⚠️ DEBUG: Unknown DataFrame type: {type(df)}[/red]")
                         validation_details = {"type": "Unknown", "assumed_quality": "UNRELIABLE"}
@@ -1138,7 +1640,10 @@ class EnhancedModernBarDataProvider:
                         completeness = 0
                         data_quality_pct = 0
 
-                    console.print(f"[blue]📊 DEBUG: Data type: {data_type}, NaN rows: {nan_rows}, Completeness: {completeness:.3f}[/blue]")
+                    log.debug(
+                        "Data type: %s, NaN rows: %s, Completeness: %.3f",
+                        data_type, nan_rows, completeness,
+                    )
 
                     # 🚨 ENFORCE 100% DATA QUALITY - NO COMPROMISE
                     if completeness != 1.0 or nan_rows > 0:
@@ -1178,7 +1683,7 @@ class EnhancedModernBarDataProvider:
                     "audit_timestamp": datetime.now().isoformat(),
                 }
 
-                console.print(f"[cyan]📋 DEBUG: Validation results stored for audit: {validation_results}[/cyan]")
+                log.debug("Validation results stored for audit: %s", validation_results)
 
                 progress.update(task, advance=limit//4)
 
@@ -1190,30 +1695,39 @@ class EnhancedModernBarDataProvider:
                 self._validate_data_against_specs(processed_df)
                 progress.update(task, advance=limit//4)
 
-                # Cache for performance
-                cache_path = self.data_manager.cache_to_parquet(processed_df, f"{symbol}_validated_market_data")
+                # Cache for performance, keyed by the request tuple so repeat
+                # runs can read it back before fetching
+                cache_path = self.data_manager.cache_to_parquet(processed_df, cache_key)
             else:
                 raise RuntimeError("Data manager not available")
 
-            # Convert to NautilusTrader format with correct specifications
-            # Round data to match real Binance precision
-            processed_df = self._adjust_data_precision(processed_df, instrument)
-
-            # Create bars manually to ensure correct precision
-            bars = self._create_bars_with_correct_precision(processed_df, instrument, bar_type)
-            progress.update(task, advance=limit//4)
+            return self._finalize_processed_df(
+                processed_df, instrument, bar_type, symbol, cache_path, progress, task, limit,
+            )
 
-            # Enhanced logging
-            if self.data_manager:
-                stats = self.data_manager.get_data_stats(processed_df)
-            else:
-                stats = {"memory_usage_mb": 0, "price_stats": {"range": 0}}
-            console.print(f"[green]✅ Fetched {len(bars)} validated PERPETUAL FUTURES bars for {symbol}[/green]")
-            console.print(f"[blue]📊 Validated data cached to: {cache_path.name}[/blue]")
-            console.print(f"[yellow]⚡ Memory usage: {stats['memory_usage_mb']:.1f}MB[/yellow]")
-            console.print(f"[magenta]💰 Price range: ${stats['price_stats']['range']:.5f}[/magenta]")
+    def _finalize_processed_df(
+        self, processed_df, instrument, bar_type, symbol, cache_path, progress, task, limit,
+    ) -> list[Bar]:
+        """Adjust precision, build bars and report stats for a validated frame."""
+        # Convert to NautilusTrader format with correct specifications
+        # Round data to match real Binance precision
+        processed_df = self._adjust_data_precision(processed_df, instrument)
+
+        # Create bars manually to ensure correct precision
+        bars = self._create_bars_with_correct_precision(processed_df, instrument, bar_type)
+        progress.update(task, advance=limit//4)
+
+        # Enhanced logging
+        if self.data_manager:
+            stats = self.data_manager.get_data_stats(processed_df)
+        else:
+            stats = {"memory_usage_mb": 0, "price_stats": {"range": 0}}
+        console.print(f"[green]✅ Fetched {len(bars)} validated PERPETUAL FUTURES bars for {symbol}[/green]")
+        console.print(f"[blue]📊 Validated data cached to: {cache_path.name}[/blue]")
+        console.print(f"[yellow]⚡ Memory usage: {stats['memory_usage_mb']:.1f}MB[/yellow]")
+        console.print(f"[magenta]💰 Price range: ${stats['price_stats']['range']:.5f}[/magenta]")
 
-            return bars
+        return bars
 
     def _validate_data_against_specs(self, df):
         """Validate fetched data conforms to real Binance specifications."""
@@ -1223,12 +1737,18 @@ class EnhancedModernBarDataProvider:
 
         specs = self.specs_manager.specs
 
-        # Check price precision
-        sample_prices = df["close"].head(10)
-        for price in sample_prices:
-            decimals = len(str(price).split(".")[-1]) if "." in str(price) else 0
-            if decimals > specs["price_precision"]:
-                console.print(f"[yellow]⚠️ Price precision mismatch: {price} has {decimals} decimals, expected {specs['price_precision']}[/yellow]")
+        # Check price precision in one ufunc pass: a price violates the spec
+        # precision iff scaling by 10**precision leaves a fractional part.
+        # The single ufunc is cheap enough to cover every close, not a sample
+        scale = 10.0 ** specs["price_precision"]
+        scaled = np.asarray(df["close"], dtype=np.float64) * scale
+        violations = int((np.abs(scaled - np.round(scaled)) > 1e-6).sum())
+        if violations:
+            console.print(
+                f"[yellow]⚠️ Price precision mismatch: {violations} of "
+                f"{scaled.size} close prices exceed {specs['price_precision']} decimals[/yellow]",
+            )
+            return
 
         console.print("[green]✅ Data validation passed - conforms to real Binance specifications[/green]")
 
@@ -1236,44 +1756,7 @@ class EnhancedModernBarDataProvider:
         """Adjust data precision to match real Binance instrument specifications."""
         console.print(f"[cyan]🔧 Adjusting data precision to match real specs (price: {instrument.price_precision}, size: {instrument.size_precision})...[/cyan]")
 
-        try:
-            # Handle Polars DataFrame
-            import polars as pl
-            if hasattr(df, "with_columns"):
-                # Polars DataFrame - use with_columns
-                price_cols = ["open", "high", "low", "close"]
-                volume_cols = ["volume"]
-
-                expressions = []
-                for col in price_cols:
-                    if col in df.columns:
-                        expressions.append(pl.col(col).round(instrument.price_precision))
-
-                for col in volume_cols:
-                    if col in df.columns:
-                        expressions.append(pl.col(col).round(instrument.size_precision))
-
-                if expressions:
-                    df = df.with_columns(expressions)
-            else:
-                # Pandas DataFrame - use direct assignment
-                price_cols = ["open", "high", "low", "close"]
-                for col in price_cols:
-                    if col in df.columns:
-                        df[col] = df[col].round(instrument.price_precision)
-
-                if "volume" in df.columns:
-                    df["volume"] = df["volume"].round(instrument.size_precision)
-
-        except ImportError:
-            # Fallback for pandas
-            price_cols = ["open", "high", "low", "close"]
-            for col in price_cols:
-                if col in df.columns:
-                    df[col] = df[col].round(instrument.price_precision)
-
-            if "volume" in df.columns:
-                df["volume"] = df["volume"].round(instrument.size_precision)
+        df = _round_ohlcv(df, instrument.price_precision, instrument.size_precision)
 
         console.print("[green]✅ Data precision adjusted to match real Binance specifications[/green]")
         return df
@@ -1282,131 +1765,151 @@ class EnhancedModernBarDataProvider:
         """Create NautilusTrader bars with exact precision specifications."""
         console.print(f"[cyan]🔧 Creating bars with exact precision (price: {instrument.price_precision}, size: {instrument.size_precision})...[/cyan]")
 
-        bars = []
+        n = len(df)
 
-        # Convert Polars to Pandas for easier iteration
-        if hasattr(df, "to_pandas"):
-            df = df.to_pandas()
-        else:
-            df = df
-
-        # Add timestamp column if missing
-        if "timestamp" not in df.columns and hasattr(df, "index"):
-            df = df.reset_index()
-            if "time" in df.columns:
-                df["timestamp"] = df["time"]
-            elif df.index.name == "time":
-                df["timestamp"] = df.index
+        # Columnar extraction straight from whichever frame arrived - Polars
+        # get_column().to_numpy() is a zero-copy view for primitive dtypes,
+        # where the previous to_pandas() conversion copied the whole frame
+        if pl is not None and isinstance(df, pl.DataFrame):
+            if pa is not None:
+                # to_arrow() is a zero-copy view of the Polars buffers; pull
+                # each column out of the same Arrow table end to end
+                tbl = df.to_arrow()
 
-        for i, row in df.iterrows():
-            try:
-                # Get timestamp with safe handling - FIXED: Use close_time instead of timestamp
-                timestamp = None
-                try:
-                    # Priority 1: Use close_time (correct historical dates)
-                    if "close_time" in row and not pd.isna(row["close_time"]):
-                        timestamp = pd.Timestamp(row["close_time"])
-                    # Priority 2: Use timestamp (fallback, may be wrong dates)
-                    elif "timestamp" in row and not pd.isna(row["timestamp"]):
-                        timestamp = pd.Timestamp(row["timestamp"])
-                        console.print(f"[yellow]⚠️ Using timestamp column (may be wrong dates): {timestamp}[/yellow]")
-                    # Priority 3: Use row name/index
-                    elif hasattr(row, "name") and row.name is not None:
-                        # Check if row.name is not NaT/NaN
-                        if not pd.isna(row.name):
-                            timestamp = pd.Timestamp(row.name)
-                except (ValueError, TypeError):
-                    timestamp = None
-
-                # Fallback if no valid timestamp - use historical date range
-                if timestamp is None:
-                    # Use the actual historical date range from TIME_SPAN_3 (Nov 20-22, 2024)
-                    historical_start = datetime(2024, 11, 20, 10, 0, 0)  # Nov 20, 2024 10:00 AM
-                    base_time = historical_start + timedelta(minutes=i)
-                    timestamp = pd.Timestamp(base_time)
-
-                # Convert to nanoseconds safely
-                try:
-                    # Validate timestamp is not NaT/None and has timestamp method
-                    is_nat = False
-                    try:
-                        is_nat = pd.isna(timestamp) if hasattr(pd, "isna") else False
-                    except (ValueError, TypeError):
-                        pass
-
-                    if timestamp is None or bool(is_nat) or not hasattr(timestamp, "timestamp"):
-                        # Use the actual historical date range from TIME_SPAN_3 (Nov 20-22, 2024)
-                        historical_start = datetime(2024, 11, 20, 10, 0, 0)  # Nov 20, 2024 10:00 AM
-                        base_time = historical_start + timedelta(minutes=i)
-                        timestamp = pd.Timestamp(base_time)
-
-                    # Safe timestamp conversion
-                    ts_ns = int(timestamp.timestamp() * 1_000_000_000)  # type: ignore[attr-defined]
-
-                except (ValueError, TypeError, AttributeError, OSError):
-                    # Final fallback - create synthetic timestamp using historical date range
-                    historical_start = datetime(2024, 11, 20, 10, 0, 0)  # Nov 20, 2024 10:00 AM
-                    base_time = historical_start + timedelta(minutes=i)
-                    ts_ns = int(base_time.timestamp() * 1_000_000_000)
-
-                # Create price and quantity objects with exact precision
-                bar = Bar(
-                    bar_type=bar_type,
-                    open=Price.from_str(f"{float(row['open']):.{instrument.price_precision}f}"),
-                    high=Price.from_str(f"{float(row['high']):.{instrument.price_precision}f}"),
-                    low=Price.from_str(f"{float(row['low']):.{instrument.price_precision}f}"),
-                    close=Price.from_str(f"{float(row['close']):.{instrument.price_precision}f}"),
-                    volume=Quantity.from_str(f"{float(row['volume']):.{instrument.size_precision}f}"),
-                    ts_event=ts_ns,
-                    ts_init=ts_ns,
-                )
-                bars.append(bar)
+                def _col(name: str) -> np.ndarray:
+                    return tbl.column(name).combine_chunks().to_numpy(zero_copy_only=False)
+            else:
+                def _col(name: str) -> np.ndarray:
+                    return df.get_column(name).to_numpy()
+
+            opens = _col("open").astype(np.float64, copy=False)
+            highs = _col("high").astype(np.float64, copy=False)
+            lows = _col("low").astype(np.float64, copy=False)
+            closes = _col("close").astype(np.float64, copy=False)
+            volumes = _col("volume").astype(np.float64, copy=False)
+            if "close_time" in df.columns:
+                ts_raw = _col("close_time")
+            elif "timestamp" in df.columns:
+                ts_raw = _col("timestamp")
+                console.print("[yellow]⚠️ Using timestamp column (may be wrong dates)[/yellow]")
+            else:
+                ts_raw = None
+        else:
+            opens = df["open"].to_numpy(dtype=np.float64)
+            highs = df["high"].to_numpy(dtype=np.float64)
+            lows = df["low"].to_numpy(dtype=np.float64)
+            closes = df["close"].to_numpy(dtype=np.float64)
+            volumes = df["volume"].to_numpy(dtype=np.float64)
+            if "close_time" in df.columns:
+                ts_raw = df["close_time"]
+            elif "timestamp" in df.columns:
+                ts_raw = df["timestamp"]
+                console.print("[yellow]⚠️ Using timestamp column (may be wrong dates)[/yellow]")
+            else:
+                ts_raw = df.index
 
-            except Exception as e:
-                console.print(f"[yellow]⚠️ Skipping bar {i}: {e}[/yellow]")
-                continue
+        # Vectorized nanosecond timestamps - FIXED: prefer close_time (correct
+        # historical dates) over the timestamp column
+        if ts_raw is None:
+            ts_ns = np.empty(n, dtype=np.int64)
+            invalid = np.ones(n, dtype=bool)
+        else:
+            ts = pd.to_datetime(ts_raw, errors="coerce")
+            ts_ns = ts.to_numpy(dtype="datetime64[ns]").astype(np.int64)
+            invalid = np.asarray(pd.isna(ts))
+
+        # Fill invalid timestamps from the actual historical date range of
+        # TIME_SPAN_3 (Nov 20-22, 2024), one synthetic minute per row
+        if invalid.any():
+            fallback_ns = _HISTORICAL_BASE_NS + np.arange(n, dtype=np.int64) * _NS_PER_MINUTE
+            ts_ns = np.where(invalid, fallback_ns, ts_ns)
+
+        # One vectorized validity filter replaces the per-row try/except: a
+        # row is dropped iff any OHLCV field is NaN, so the construction loop
+        # below runs without exception handling in the hot path
+        valid = ~(
+            np.isnan(opens) | np.isnan(highs) | np.isnan(lows)
+            | np.isnan(closes) | np.isnan(volumes)
+        )
+        dropped = int(n - int(valid.sum()))
+        if dropped:
+            console.print(f"[yellow]⚠️ Skipping {dropped} bars with NaN fields[/yellow]")
+            opens = opens[valid]
+            highs = highs[valid]
+            lows = lows[valid]
+            closes = closes[valid]
+            volumes = volumes[valid]
+            ts_ns = ts_ns[valid]
+
+        # Hand the per-bar construction to NautilusTrader's BarDataWrangler,
+        # whose Cython loop builds the Bar objects from the aligned columns in
+        # one call - the frame wraps the existing arrays without copying
+        frame = pd.DataFrame(
+            {
+                "open": opens,
+                "high": highs,
+                "low": lows,
+                "close": closes,
+                "volume": volumes,
+            },
+            index=pd.DatetimeIndex(ts_ns.view("datetime64[ns]"), name="timestamp"),
+        )
+        wrangler = BarDataWrangler(bar_type=bar_type, instrument=instrument)
+        bars = wrangler.process(frame)
+        self._last_closes = closes
 
         console.print(f"[green]✅ Created {len(bars)} bars with exact precision specifications[/green]")
         return bars
 
-    def _create_synthetic_bars_with_real_specs(self, instrument: CryptoPerpetual, count: int) -> list[Bar]:
+    def _create_synthetic_bars_with_real_specs(
+        self,
+        instrument: CryptoPerpetual,
+        bar_type: BarType,
+        count: int,
+    ) -> list[Bar]:
         """Create synthetic bars using real specifications."""
-        import random
-
         console.print("[yellow]📊 Creating synthetic bars with REAL Binance specifications...[/yellow]")
 
-        bars = []
         if not self.specs_manager.specs:
             raise ValueError("Specifications not available")
         current_price = self.specs_manager.specs["current_price"]
         # Use historical date range for TIME_SPAN_3 (Nov 20-22, 2024)
-        base_time = datetime(2024, 11, 20, 10, 0, 0)  # Nov 20, 2024 10:00 AM
+        base_time = TIME_SPAN_3_START
+
+        # Simple random walk with correct precision, generated by the
+        # module-level array kernel; fixed seed keeps synthetic runs
+        # reproducible (matches the FillModel random_seed convention)
+        rng = np.random.default_rng(42)
+        opens, highs, lows, closes, volumes = _generate_synthetic_ohlcv(
+            count, current_price, rng,
+        )
+        self._last_closes = closes
+
+        # All nanosecond timestamps in one date_range call - no per-bar
+        # timedelta allocation or .timestamp() float roundtrip
+        ts_ns = pd.date_range(base_time, periods=count, freq="1min").asi8
+
+        price_precision = instrument.price_precision
+        size_precision = instrument.size_precision
 
+        # Pre-size the list so the loop assigns by index instead of growing
+        # through append reallocations
+        bars: list[Bar] = [None] * count  # type: ignore[list-item]
         for i in range(count):
-            # Simple random walk
-            price_change = random.uniform(-0.002, 0.002)
-            current_price *= (1 + price_change)
-
-            # Create OHLC with correct precision
-            open_price = current_price * random.uniform(0.999, 1.001)
-            close_price = current_price * random.uniform(0.999, 1.001)
-            high_price = max(open_price, close_price) * random.uniform(1.0, 1.002)
-            low_price = min(open_price, close_price) * random.uniform(0.998, 1.0)
-            volume = random.uniform(0.1, 2.0)  # Use real step size
-
-            timestamp = int((base_time + timedelta(minutes=i)).timestamp() * 1_000_000_000)
-
-            bar = Bar(
-                bar_type=BarType.from_str(f"{instrument.id}-1-MINUTE-LAST-EXTERNAL"),
-                open=Price.from_str(f"{open_price:.{instrument.price_precision}f}"),
-                high=Price.from_str(f"{high_price:.{instrument.price_precision}f}"),
-                low=Price.from_str(f"{low_price:.{instrument.price_precision}f}"),
-                close=Price.from_str(f"{close_price:.{instrument.price_precision}f}"),
-                volume=Quantity.from_str(f"{volume:.{instrument.size_precision}f}"),
+            timestamp = int(ts_ns[i])
+
+            # Numeric constructors skip the f-string format -> parse roundtrip
+            # per field
+            bars[i] = Bar(
+                bar_type=bar_type,
+                open=Price(opens[i], price_precision),
+                high=Price(highs[i], price_precision),
+                low=Price(lows[i], price_precision),
+                close=Price(closes[i], price_precision),
+                volume=Quantity(volumes[i], size_precision),
                 ts_event=timestamp,
                 ts_init=timestamp,
             )
-            bars.append(bar)
 
         console.print(f"[green]✅ Created {len(bars)} synthetic bars with real Binance specifications[/green]")
         return bars
@@ -1451,6 +1954,9 @@ async def main():
         risk_engine=RiskEngineConfig(bypass=True),
     )
     engine = BacktestEngine(config=config)
+    # The cache property crosses into Cython on each access - grab it once
+    # and reuse the local for all diagnostics below
+    cache = engine.cache
 
     # Add venue with REAL Binance VIP 3 fees
     # Note: MakerTakerFeeModel uses the fees defined on the instrument
@@ -1494,14 +2000,18 @@ async def main():
     
     # 🔍 DIAGNOSTIC: Check bar distribution across time span
     if bars:
-        first_bar_time = pd.Timestamp(bars[0].ts_event, unit="ns")
-        last_bar_time = pd.Timestamp(bars[-1].ts_event, unit="ns")
-        duration_hours = (last_bar_time - first_bar_time).total_seconds() / 3600
+        n_bars = len(bars)
+        first_ns = bars[0].ts_event
+        last_ns = bars[-1].ts_event
+        # Duration from the raw nanosecond ints - Timestamps are only built
+        # for the human-readable lines (pd.Timestamp treats bare int input
+        # as nanoseconds, so no unit= kwarg is needed)
+        duration_hours = (last_ns - first_ns) / 1e9 / 3600
         console.print("[bold yellow]🔍 Bar Time Distribution:[/bold yellow]")
-        console.print(f"[yellow]📅 First bar: {first_bar_time}[/yellow]")
-        console.print(f"[yellow]📅 Last bar: {last_bar_time}[/yellow]")
+        console.print(f"[yellow]📅 First bar: {pd.Timestamp(first_ns)}[/yellow]")
+        console.print(f"[yellow]📅 Last bar: {pd.Timestamp(last_ns)}[/yellow]")
         console.print(f"[yellow]⏱️ Duration: {duration_hours:.1f} hours (expected: 48 hours)[/yellow]")
-        console.print(f"[yellow]📊 Bars per hour: {len(bars) / duration_hours:.1f}[/yellow]")
+        console.print(f"[yellow]📊 Bars per hour: {n_bars / duration_hours:.1f}[/yellow]")
     # NOTE: Hold bars, add them after strategy configuration to avoid "unknown bar type" error
 
     # 🔍 ENHANCED VALIDATION: Proper data validation with realistic BTC price ranges
@@ -1512,12 +2022,17 @@ async def main():
         return
 
     # Check for realistic BTC price ranges (BTC typically $50k-$150k in 2024-2025)
-    sample_prices = [float(bar.close) for bar in bars[:10]]
-    console.print(f"[cyan]🔍 DEBUG: Sample prices: {sample_prices}[/cyan]")
-
-    unrealistic_prices = [p for p in sample_prices if p < 20000 or p > 200000]
-    if unrealistic_prices:
-        console.print(f"[red]❌ FATAL: Unrealistic BTC prices detected: {unrealistic_prices}[/red]")
+    # The provider stashes the close array it built the bars from, so the
+    # sample check runs on floats directly instead of Price -> float round-trips
+    closes = data_provider._last_closes
+    if closes is None:
+        closes = np.array([float(bar.close) for bar in bars[:10]])
+    sample_prices = closes[:10]
+    console.print(f"[cyan]🔍 DEBUG: Sample prices: {sample_prices.tolist()}[/cyan]")
+
+    bad_mask = (sample_prices < 20000) | (sample_prices > 200000)
+    if bad_mask.any():
+        console.print(f"[red]❌ FATAL: Unrealistic BTC prices detected: {sample_prices[bad_mask].tolist()}[/red]")
         console.print("[red]📊 Expected range: $20,000 - $200,000 for BTC[/red]")
         return
 
@@ -1576,53 +2091,52 @@ async def main():
     if not bars:
         raise ValueError("CRITICAL: No bars available for engine registration!")
 
-    # Log first few bars for validation
-    console.print(f"[cyan]🔍 DEBUG: First bar details: {bars[0]}[/cyan]")
-    console.print(f"[cyan]🔍 DEBUG: Bar type from first bar: {bars[0].bar_type}[/cyan]")
-    console.print(f"[cyan]🔍 DEBUG: Expected bar type: {bar_type}[/cyan]")
+    if DEBUG:
+        # Log first few bars for validation
+        console.print(f"[cyan]🔍 DEBUG: First bar details: {bars[0]}[/cyan]")
+        console.print(f"[cyan]🔍 DEBUG: Bar type from first bar: {bars[0].bar_type}[/cyan]")
+        console.print(f"[cyan]🔍 DEBUG: Expected bar type: {bar_type}[/cyan]")
 
-    # Verify bar types match expected
-    bar_type_matches = all(bar.bar_type == bar_type for bar in bars[:10])  # Check first 10
-    console.print(f"[cyan]🔍 DEBUG: Bar type consistency check: {bar_type_matches}[/cyan]")
+        # Verify bar types match expected - every bar shares the one hoisted
+        # BarType object, so checking the first bar is equivalent to scanning
+        bar_type_matches = bars[0].bar_type == bar_type
+        console.print(f"[cyan]🔍 DEBUG: Bar type consistency check: {bar_type_matches}[/cyan]")
 
-    if not bar_type_matches:
-        console.print("[red]🚨 FATAL: Bar type mismatch detected![/red]")
-        raise ValueError(f"Bar type mismatch: Expected {bar_type}, but bars have different types")
+        if not bar_type_matches:
+            console.print("[red]🚨 FATAL: Bar type mismatch detected![/red]")
+            raise ValueError(f"Bar type mismatch: Expected {bar_type}, but bars have different types")
 
-    # 🔍 DEEP DEBUG: Comprehensive bar type registration investigation
-    console.print("[yellow]🔍 DEEP DEBUG: Investigating bar type registration flow...[/yellow]")
+        # 🔍 DEEP DEBUG: Comprehensive bar type registration investigation
+        dbg_console.print("🔍 DEEP DEBUG: Investigating bar type registration flow...")
 
-    # Step 1: Verify engine state before adding data
-    console.print(f"[blue]📊 DEEP DEBUG: Engine instruments before data: {[str(i) for i in engine.cache.instruments()]}[/blue]")
+        # Step 1: Verify engine state before adding data
+        dbg_console.print(f"📊 DEEP DEBUG: Engine instruments before data: {[str(i) for i in cache.instruments()]}")
 
-    # Step 2: Add bars to engine FIRST with detailed logging
-    console.print(f"[blue]📊 DEEP DEBUG: Adding {len(bars)} bars to engine...[/blue]")
-    console.print(f"[blue]🔧 DEEP DEBUG: Expected bar types to be registered: {set(bar.bar_type for bar in bars[:5])}[/blue]")
+        # Step 2: Add bars to engine FIRST with detailed logging
+        dbg_console.print(f"📊 DEEP DEBUG: Adding {len(bars)} bars to engine...")
+        dbg_console.print(f"🔧 DEEP DEBUG: Expected bar type to be registered: {bar_type}")
 
     engine.add_data(bars)
     console.print(f"[green]✅ DEBUG: {len(bars)} bars successfully added to engine[/green]")
 
-    # Step 3: Verify engine state after adding data
-    console.print("[blue]📊 DEEP DEBUG: Engine state after adding data...[/blue]")
-    try:
-        # Try to access engine's internal bar type registry
-        console.print(f"[blue]🔍 DEEP DEBUG: Engine cache has instruments: {len(engine.cache.instruments())}[/blue]")
-        console.print(f"[blue]🔍 DEEP DEBUG: Engine cache bars count: {engine.cache.bar_count(bar_type)}[/blue]")
-
-        # Check if our bar type is in the cache
-        bars_in_cache = []
-        for bar_type_cached in engine.cache.bar_types():
-            bars_in_cache.append(str(bar_type_cached))
-            console.print(f"[cyan]🔍 DEEP DEBUG: Cached bar type: {bar_type_cached}[/cyan]")
-
-        if str(bar_type) in bars_in_cache:
-            console.print(f"[green]✅ DEEP DEBUG: Target bar type {bar_type} IS in engine cache[/green]")
-        else:
-            console.print(f"[red]🚨 DEEP DEBUG: Target bar type {bar_type} NOT in engine cache![/red]")
-            console.print(f"[red]📊 DEEP DEBUG: Available bar types: {bars_in_cache}[/red]")
+    if DEBUG:
+        # Step 3: Verify engine state after adding data
+        dbg_console.print("📊 DEEP DEBUG: Engine state after adding data...")
+        try:
+            # Try to access engine's internal bar type registry
+            dbg_console.print(f"🔍 DEEP DEBUG: Engine cache has instruments: {len(cache.instruments())}")
+            dbg_console.print(f"🔍 DEEP DEBUG: Engine cache bars count: {cache.bar_count(bar_type)}")
+
+            # Check if our bar type is in the cache - bar_count is a direct
+            # lookup, no need to enumerate and stringify every cached type
+            if cache.bar_count(bar_type) > 0:
+                dbg_console.print(f"✅ DEEP DEBUG: Target bar type {bar_type} IS in engine cache")
+            else:
+                dbg_console.print(f"🚨 DEEP DEBUG: Target bar type {bar_type} NOT in engine cache!")
+                dbg_console.print(f"📊 DEEP DEBUG: Available bar types: {[str(bt) for bt in cache.bar_types()]}")
 
-    except Exception as e:
-        console.print(f"[yellow]⚠️ DEEP DEBUG: Could not inspect engine cache: {e}[/yellow]")
+        except Exception as e:
+            dbg_console.print(f"⚠️ DEEP DEBUG: Could not inspect engine cache: {e}")
 
     # STEP 6B: Now configure ENHANCED PROFITABLE strategy AFTER bars are registered
     console.print("[blue]🔧 DEBUG: Configuring ENHANCED PROFITABLE strategy AFTER bar registration...[/blue]")
@@ -1631,42 +2145,43 @@ async def main():
     strategy_config = create_sota_strategy_config(
         instrument_id=instrument.id,
         bar_type=bar_type,
-        trade_size=Decimal(f"{position_calc['position_size_btc']:.3f}"),  # REALISTIC SIZE!
+        trade_size=Decimal(position_calc["position_size_btc"]).quantize(_Q3),  # REALISTIC SIZE!
     )
 
     console.print(f"[cyan]🔧 DEBUG: Enhanced strategy configured for bar_type: {bar_type}[/cyan]")
     console.print(f"[cyan]🔧 DEBUG: Enhanced strategy instrument_id: {instrument.id}[/cyan]")
     console.print(f"[cyan]💰 DEBUG: Enhanced strategy trade_size: {position_calc['position_size_btc']:.3f} BTC[/cyan]")
 
-    # Step 4: Verify strategy configuration details
-    console.print(f"[blue]🔍 DEEP DEBUG: Enhanced strategy config bar_type: {strategy_config.bar_type}[/blue]")
-    console.print(f"[blue]🔍 DEEP DEBUG: Enhanced strategy config instrument_id: {strategy_config.instrument_id}[/blue]")
-    console.print(f"[blue]🧪 DEEP DEBUG: Bar type equality check: {strategy_config.bar_type == bar_type}[/blue]")
-    console.print(f"[blue]🧪 DEEP DEBUG: Instrument ID equality check: {strategy_config.instrument_id == instrument.id}[/blue]")
+    if DEBUG:
+        # Step 4: Verify strategy configuration details
+        dbg_console.print(f"🔍 DEEP DEBUG: Enhanced strategy config bar_type: {strategy_config.bar_type}")
+        dbg_console.print(f"🔍 DEEP DEBUG: Enhanced strategy config instrument_id: {strategy_config.instrument_id}")
+        dbg_console.print(f"🧪 DEEP DEBUG: Bar type equality check: {strategy_config.bar_type == bar_type}")
+        dbg_console.print(f"🧪 DEEP DEBUG: Instrument ID equality check: {strategy_config.instrument_id == instrument.id}")
 
     strategy = SOTAProfitableStrategy(config=strategy_config)
 
-    # Step 5: Add strategy with pre-flight checks
-    console.print("[blue]🔧 DEEP DEBUG: Adding strategy to engine...[/blue]")
-    console.print(f"[blue]🔍 DEEP DEBUG: Strategy will request bar_type: {strategy_config.bar_type}[/blue]")
+    if DEBUG:
+        # Step 5: Add strategy with pre-flight checks
+        dbg_console.print("🔧 DEEP DEBUG: Adding strategy to engine...")
+        dbg_console.print(f"🔍 DEEP DEBUG: Strategy will request bar_type: {strategy_config.bar_type}")
 
     engine.add_strategy(strategy=strategy)
     console.print("[green]✅ DEBUG: Strategy successfully added to engine[/green]")
 
-    # Step 6: Final verification before engine run
-    console.print("[blue]🔍 DEEP DEBUG: Final verification before engine.run()...[/blue]")
-    try:
-        final_bar_types = [str(bt) for bt in engine.cache.bar_types()]
-        console.print(f"[blue]📊 DEEP DEBUG: Final bar types in cache: {final_bar_types}[/blue]")
-        console.print(f"[blue]🎯 DEEP DEBUG: Strategy expecting: {strategy_config.bar_type}[/blue]")
+    if DEBUG:
+        # Step 6: Final verification before engine run
+        dbg_console.print("🔍 DEEP DEBUG: Final verification before engine.run()...")
+        try:
+            dbg_console.print(f"🎯 DEEP DEBUG: Strategy expecting: {strategy_config.bar_type}")
 
-        if str(strategy_config.bar_type) in final_bar_types:
-            console.print("[green]✅ DEEP DEBUG: Bar type match confirmed - should work![/green]")
-        else:
-            console.print("[red]🚨 DEEP DEBUG: Bar type mismatch detected - will fail![/red]")
-            console.print("[red]💥 DEEP DEBUG: This WILL cause 'unknown bar type' error![/red]")
-    except Exception as e:
-        console.print(f"[yellow]⚠️ DEEP DEBUG: Could not perform final verification: {e}[/yellow]")
+            if cache.bar_count(strategy_config.bar_type) > 0:
+                dbg_console.print("✅ DEEP DEBUG: Bar type match confirmed - should work!")
+            else:
+                dbg_console.print("🚨 DEEP DEBUG: Bar type mismatch detected - will fail!")
+                dbg_console.print("💥 DEEP DEBUG: This WILL cause 'unknown bar type' error!")
+        except Exception as e:
+            dbg_console.print(f"⚠️ DEEP DEBUG: Could not perform final verification: {e}")
 
     # STEP 6C: Validate the complete registration
     console.print("[blue]🔍 DEBUG: Validating complete bar type registration...[/blue]")
@@ -1692,71 +2207,77 @@ async def main():
     # Step 6.6: Add Native FinplotActor for real-time chart visualization
     console.print("[bold magenta]🎯 STEP 6.6: Native FinplotActor Integration[/bold magenta]")
 
-    # Add native FinplotActor to engine (NATIVE FINPLOT PATTERN!)
-    finplot_actor = FinplotActor(config=None)
-    engine.add_actor(finplot_actor)
-    console.print("[green]✅ Native FinplotActor integrated - real-time charts ready[/green]")
-    console.print("[cyan]📊 Charts will update live via MessageBus events (100% native)[/cyan]")
+    if ENABLE_CHART:
+        # Add native FinplotActor to engine (NATIVE FINPLOT PATTERN!)
+        finplot_actor = FinplotActor(config=None, bar_type=bar_type)
+        engine.add_actor(finplot_actor)
+        console.print("[green]✅ Native FinplotActor integrated - real-time charts ready[/green]")
+        console.print("[cyan]📊 Charts will update live via MessageBus events (100% native)[/cyan]")
+    else:
+        console.print("[yellow]⚠️ Charts disabled (ENABLE_CHART=0) - running headless[/yellow]")
 
     # Step 7: Run ultimate backtest
     console.print("\n" + "="*80)
     console.print("[bold white]🎯 STEP 7: Ultimate Backtest Execution[/bold white]")
 
-    # 🔍 DEEP DEBUG: Monitor engine run execution with error capture
-    console.print("[yellow]🔍 DEEP DEBUG: Starting engine.run() with full error monitoring...[/yellow]")
+    if DEBUG:
+        # 🔍 DEEP DEBUG: Monitor engine run execution with error capture
+        dbg_console.print("🔍 DEEP DEBUG: Starting engine.run() with full error monitoring...")
 
     try:
         with console.status("[bold green]Running ultimate backtest...", spinner="dots"):
-            console.print("[blue]🚀 DEEP DEBUG: Engine.run() starting...[/blue]")
+            if DEBUG:
+                dbg_console.print("🚀 DEEP DEBUG: Engine.run() starting...")
             engine.run()
-            console.print("[blue]✅ DEEP DEBUG: Engine.run() completed without exceptions[/blue]")
+            if DEBUG:
+                dbg_console.print("✅ DEEP DEBUG: Engine.run() completed without exceptions")
 
     except Exception as engine_error:
-        console.print(f"[red]💥 DEEP DEBUG: Engine.run() failed with exception: {engine_error}[/red]")
-        console.print(f"[red]📊 DEEP DEBUG: Exception type: {type(engine_error)}[/red]")
-        import traceback
-        console.print(f"[red]🔍 DEEP DEBUG: Full traceback:\n{traceback.format_exc()}[/red]")
+        dbg_console.print(f"💥 DEEP DEBUG: Engine.run() failed with exception: {engine_error}")
+        dbg_console.print(f"📊 DEEP DEBUG: Exception type: {type(engine_error)}")
+        dbg_console.print(f"🔍 DEEP DEBUG: Full traceback:\n{traceback.format_exc()}")
         raise  # Re-raise to maintain error behavior
 
     console.print("✅ [bold green]Ultimate backtest completed![/bold green]")
 
-    # 🔍 DEEP DEBUG: Post-execution analysis
-    console.print("[yellow]🔍 DEEP DEBUG: Post-execution analysis...[/yellow]")
-    try:
-        console.print(f"[blue]📊 DEEP DEBUG: Final engine cache bar count: {engine.cache.bar_count(bar_type)}[/blue]")
-        console.print(f"[blue]📊 DEEP DEBUG: Final engine cache order count: {engine.cache.orders_total_count()}[/blue]")
-        console.print(f"[blue]📊 DEEP DEBUG: Final engine cache position count: {engine.cache.positions_total_count()}[/blue]")
-
-        # 🔍 CRITICAL ANALYSIS: Check if trades were actually executed despite error message
+    if DEBUG:
+        # 🔍 DEEP DEBUG: Post-execution analysis
+        dbg_console.print("🔍 DEEP DEBUG: Post-execution analysis...")
         try:
-            orders = engine.cache.orders()
-            positions = engine.cache.positions()
+            dbg_console.print(f"📊 DEEP DEBUG: Final engine cache bar count: {cache.bar_count(bar_type)}")
+            dbg_console.print(f"📊 DEEP DEBUG: Final engine cache order count: {cache.orders_total_count()}")
+            dbg_console.print(f"📊 DEEP DEBUG: Final engine cache position count: {cache.positions_total_count()}")
 
-            console.print(f"[blue]🔍 DEEP DEBUG: Total orders in cache: {len(orders)}[/blue]")
-            console.print(f"[blue]🔍 DEEP DEBUG: Total positions in cache: {len(positions)}[/blue]")
+            # 🔍 CRITICAL ANALYSIS: Check if trades were actually executed despite error message
+            try:
+                orders = cache.orders()
+                positions = cache.positions()
 
-            if len(orders) == 0:
-                console.print("[red]🚨 DEEP DEBUG: NO ORDERS EXECUTED - Strategy never triggered![/red]")
-                console.print("[red]💥 DEEP DEBUG: This confirms the 'unknown bar type' error prevented execution![/red]")
-            else:
-                console.print(f"[green]✅ DEEP DEBUG: {len(orders)} ORDERS WERE EXECUTED![/green]")
-                console.print("[green]🎉 DEEP DEBUG: This means bar type registration ACTUALLY WORKED![/green]")
-                console.print("[yellow]🤔 DEEP DEBUG: The 'unknown bar type' error may be misleading or post-execution![/yellow]")
+                dbg_console.print(f"🔍 DEEP DEBUG: Total orders in cache: {len(orders)}")
+                dbg_console.print(f"🔍 DEEP DEBUG: Total positions in cache: {len(positions)}")
 
-                # Show order details to prove execution
-                for i, order in enumerate(orders[:5]):  # Show first 5 orders
-                    console.print(f"[green]📊 DEEP DEBUG: Order {i+1}: {order.instrument_id} {order.side} {order.quantity} @ {order.avg_px if hasattr(order, 'avg_px') else 'N/A'}[/green]")
+                if len(orders) == 0:
+                    dbg_console.print("🚨 DEEP DEBUG: NO ORDERS EXECUTED - Strategy never triggered!")
+                    dbg_console.print("💥 DEEP DEBUG: This confirms the 'unknown bar type' error prevented execution!")
+                else:
+                    dbg_console.print(f"✅ DEEP DEBUG: {len(orders)} ORDERS WERE EXECUTED!")
+                    dbg_console.print("🎉 DEEP DEBUG: This means bar type registration ACTUALLY WORKED!")
+                    dbg_console.print("🤔 DEEP DEBUG: The 'unknown bar type' error may be misleading or post-execution!")
 
-                # Analyze position changes
-                if len(positions) > 0:
-                    for i, position in enumerate(positions[:3]):  # Show first 3 positions
-                        console.print(f"[green]💼 DEEP DEBUG: Position {i+1}: {position.instrument_id} {position.side} {position.quantity}[/green]")
+                    # Show order details to prove execution
+                    for i, order in enumerate(orders[:5]):  # Show first 5 orders
+                        dbg_console.print(f"📊 DEEP DEBUG: Order {i+1}: {order.instrument_id} {order.side} {order.quantity} @ {order.avg_px if hasattr(order, 'avg_px') else 'N/A'}")
 
-        except Exception as orders_error:
-            console.print(f"[red]💥 DEEP DEBUG: Could not analyze orders/positions: {orders_error}[/red]")
+                    # Analyze position changes
+                    if len(positions) > 0:
+                        for i, position in enumerate(positions[:3]):  # Show first 3 positions
+                            dbg_console.print(f"💼 DEEP DEBUG: Position {i+1}: {position.instrument_id} {position.side} {position.quantity}")
 
-    except Exception as e:
-        console.print(f"[yellow]⚠️ DEEP DEBUG: Could not perform post-execution analysis: {e}[/yellow]")
+            except Exception as orders_error:
+                dbg_console.print(f"💥 DEEP DEBUG: Could not analyze orders/positions: {orders_error}")
+
+        except Exception as e:
+            dbg_console.print(f"⚠️ DEEP DEBUG: Could not perform post-execution analysis: {e}")
 
     # Step 8: Generate enhanced results and visualization
     console.print("\n" + "="*80)
@@ -1798,6 +2319,13 @@ async def main():
         else:
             console.print("[yellow]ℹ️ No production funding integration available[/yellow]")
 
+        # Import lazily - enhanced_charts pulls in finplot/Qt at module import,
+        # so deferring it keeps the backtest itself free of chart startup cost
+        from nautilus_test.visualization.enhanced_charts import (
+            create_post_backtest_chart,
+            display_ultimate_performance_summary,
+        )
+
         # Display ultimate performance summary
         if specs_manager.specs:
             display_ultimate_performance_summary(
@@ -1809,7 +2337,9 @@ async def main():
         # Display enhanced chart visualization
         console.print("\n[bold cyan]📊 Launching Enhanced Interactive Chart...[/bold cyan]")
         try:
-            if specs_manager.specs:
+            if not ENABLE_CHART:
+                console.print("[yellow]⚠️ Chart display skipped (ENABLE_CHART=0)[/yellow]")
+            elif specs_manager.specs:
                 # Create post-backtest chart with enhanced styling
                 create_post_backtest_chart(bars, fills_report, specs_manager.specs, position_calc)
                 console.print("[green]✅ Enhanced finplot chart displayed successfully[/green]")
@@ -1859,5 +2389,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())